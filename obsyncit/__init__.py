@@ -115,11 +115,11 @@ Examples:
         >>> # Create backup
         >>> info = backup_mgr.create_backup()
         >>> print(f"Created: {info.timestamp}")
-        >>> print(f"Size: {info.size_mb:.1f}MB")
+        >>> print(f"Size: {info.size():.1f}MB")
         >>> 
         >>> # List backups
         >>> for backup in backup_mgr.list_backups():
-        ...     print(f"{backup.timestamp}: {backup.size_mb:.1f}MB")
+        ...     print(f"{backup.timestamp}: {backup.size():.1f}MB")
         >>> 
         >>> # Restore backup
         >>> if backup_mgr.restore_backup():
@@ -138,18 +138,24 @@ Examples:
         ...         print(f"  {item}: {error}")
 """
 
-from obsyncit.sync import SyncManager
-from obsyncit.backup import BackupManager
-from obsyncit.vault_discovery import VaultDiscovery
-from obsyncit.schemas import Config, SyncConfig
-from obsyncit.errors import (
-    ObsyncError,
-    VaultError,
-    ConfigError,
-    BackupError,
-    SyncError,
-    ValidationError,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from obsyncit.sync import SyncManager
+    from obsyncit.backup import BackupManager
+    from obsyncit.vault_discovery import VaultDiscovery
+    from obsyncit.schemas import Config, SyncConfig
+    from obsyncit.errors import (
+        ObsyncError,
+        VaultError,
+        ConfigError,
+        BackupError,
+        SyncError,
+        ValidationError,
+    )
 
 __version__ = "0.1.0"
 
@@ -170,4 +176,49 @@ __all__ = [
     "BackupError",
     "SyncError",
     "ValidationError",
-]
\ No newline at end of file
+]
+
+# Public name -> module defining it. The modules (and loguru and pydantic
+# behind them) are imported on first attribute access (PEP 562), so
+# importing one submodule, or running ``obsyncit --help``, doesn't load
+# the whole package.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "SyncManager": "obsyncit.sync",
+    "BackupManager": "obsyncit.backup",
+    "VaultDiscovery": "obsyncit.vault_discovery",
+    "Config": "obsyncit.schemas",
+    "SyncConfig": "obsyncit.schemas",
+    "ObsyncError": "obsyncit.errors",
+    "VaultError": "obsyncit.errors",
+    "ConfigError": "obsyncit.errors",
+    "BackupError": "obsyncit.errors",
+    "SyncError": "obsyncit.errors",
+    "ValidationError": "obsyncit.errors",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access.
+
+    Args:
+        name: Attribute being looked up on the package
+
+    Returns:
+        The requested class; it is cached in the package namespace, so
+        later lookups don't come back here
+
+    Raises:
+        AttributeError: If the package has no such attribute
+    """
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the package's attributes, including not-yet-imported names."""
+    return sorted(set(globals()) | set(__all__))
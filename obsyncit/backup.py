@@ -18,6 +18,7 @@ It handles:
    - Listing available backups
    - Cleanup of old backups
    - Backup information tracking
+   - Optional deduplication of unchanged files across backups
 
 Example Usage:
     >>> from pathlib import Path
@@ -38,7 +39,7 @@ Example Usage:
     >>> # List available backups
     >>> backups = backup_mgr.list_backups()
     >>> for backup in backups:
-    ...     print(f"{backup.timestamp}: {backup.size_mb:.1f}MB")
+    ...     print(f"{backup.timestamp}: {backup.size():.1f}MB")
     >>> 
     >>> # Restore from backup
     >>> restored = backup_mgr.restore_backup()
@@ -48,24 +49,135 @@ Example Usage:
 
 from __future__ import annotations
 
+import errno
+import heapq
+import json
+import os
+import random
 import shutil
+import stat
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Sequence, Union
+from typing import (
+    AbstractSet,
+    Any,
+    ClassVar,
+    Dict,
+    Generator,
+    Iterable,
+    Optional,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from loguru import logger
 
 from obsyncit.errors import BackupError
+from obsyncit.fileops import (
+    clone_copy2,
+    fast_copy2,
+    fast_rmtree,
+    file_digest,
+    parallel_copytree,
+    pipe_copytree,
+    same_filesystem,
+)
+
+
+# os.link errors meaning the filesystem can't hardlink this file; the
+# dedupe store falls back to a plain copy for these
+_LINK_UNSUPPORTED = frozenset(
+    code for code in (
+        getattr(errno, name, None)
+        for name in ("EPERM", "EMLINK", "EXDEV", "ENOSYS", "ENOTSUP", "EOPNOTSUPP")
+    )
+    if code is not None
+)
+
+
+def _backup_name(ns: int) -> str:
+    """Build a backup directory name from a time.time_ns() timestamp.
+
+    Args:
+        ns: Creation time in nanoseconds since the epoch
+
+    Returns:
+        A name of the form ``backup_<seconds>_<nanoseconds>``
+    """
+    return f"backup_{ns // 1_000_000_000}_{ns % 1_000_000_000:09d}"
+
+
+def _parse_backup_timestamp(name: str) -> Optional[float]:
+    """Read the creation time encoded in a backup directory name.
+
+    Understands both ``backup_<seconds>_<nanoseconds>`` and the older
+    ``backup_<seconds>`` names.
+
+    Args:
+        name: Backup directory name
+
+    Returns:
+        Seconds since the epoch, or None if the name carries no timestamp
+    """
+    parts = name.split("_")
+    try:
+        seconds = int(parts[1])
+        if len(parts) == 2:
+            return float(seconds)
+        if len(parts) == 3:
+            return seconds + int(parts[2]) / 1_000_000_000
+    except (IndexError, ValueError):
+        pass
+    return None
+
+
+def _tree_size(root: Union[str, Path]) -> int:
+    """Add up the sizes of the regular files under a directory.
+
+    Walks with os.scandir, whose entries carry the file type from the
+    directory listing, so each file costs one lstat and each directory one
+    listing, where Path.rglob plus is_file() and stat() cost two stats per
+    file. Directories that vanish or can't be read mid-walk are skipped.
+
+    Args:
+        root: Directory to measure
+
+    Returns:
+        Total size in bytes
+    """
+    total = 0
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
 
 
 @dataclass
 class BackupInfo:
     """Information about a backup.
     
-    This immutable dataclass stores metadata about a backup, including
-    its location, contents, and creation time.
+    This dataclass stores metadata about a backup, including its
+    location, contents, and creation time.
     
     Attributes:
         path: Full path to the backup directory
@@ -74,13 +186,24 @@ class BackupInfo:
         has_plugins: Whether plugin data was backed up
         has_themes: Whether themes were backed up
         has_icons: Whether plugin icons were backed up
-        size_mb: Size of the backup in megabytes
+        size_mb: Size of the backup in megabytes, or None until size()
+            has measured it
+    
+    The size takes a walk of the whole backup, while everything else
+    comes from one listing of its settings directory, so unless it is
+    given to the constructor it is computed only when size() is called.
+    It is left out of repr and comparisons, so listing backups to pick
+    one to restore or delete, or logging one, never walks them. A
+    listing that shows sizes calls size(record=True), which keeps the
+    measured size in a small INFO_FILE beside the backup's settings, so
+    later listings, in this process or the next, read one file instead
+    of walking the backup again. Nothing else writes to a backup.
     
     Example:
         >>> info = BackupInfo.from_backup_path(Path("backups/backup_123456"))
         >>> print(f"Created: {datetime.fromtimestamp(info.timestamp)}")
         >>> print(f"Settings: {info.settings_count}")
-        >>> print(f"Size: {info.size_mb:.1f}MB")
+        >>> print(f"Size: {info.size():.1f}MB")
         >>> if info.has_plugins:
         ...     print("Includes plugin data")
     """
@@ -91,7 +214,88 @@ class BackupInfo:
     has_plugins: bool = False
     has_themes: bool = False
     has_icons: bool = False
-    size_mb: float = 0.0
+    size_mb: Optional[float] = field(default=None, compare=False, repr=False)
+
+    # Sidecar file recording the measured size of a backup
+    INFO_FILE: ClassVar[str] = ".obsyncit_info.json"
+    INFO_VERSION: ClassVar[int] = 1
+
+    def size(self, record: bool = False) -> float:
+        """Get the size of the backup in megabytes.
+
+        The first call reads the size recorded in the backup's INFO_FILE,
+        or measures the backup, and stores the result in size_mb.
+
+        Args:
+            record: Write a measured size to INFO_FILE for later listings
+
+        Returns:
+            Size of the backup's settings in megabytes
+        """
+        if self.size_mb is None:
+            self.size_mb = self._load_size(record) / (1024 * 1024)
+        return self.size_mb
+
+    def _load_size(self, record: bool) -> int:
+        """Read the backup's size from its sidecar file, measuring on a miss.
+
+        The sidecar stores the size together with the settings directory's
+        mtime; a sidecar whose mtime no longer matches is ignored, and
+        rewritten when record is set. Writing is best effort, so a
+        read-only backup directory is simply measured each time. Backups
+        whose names carry no timestamp are never written to, since their
+        directory mtime stands in for the creation time.
+
+        Args:
+            record: Write the sidecar after measuring
+
+        Returns:
+            Total size in bytes of the files in the backup's settings
+        """
+        settings_dir = os.path.join(self.path, ".obsidian")
+        info_path = os.path.join(self.path, self.INFO_FILE)
+        try:
+            settings_mtime = os.stat(settings_dir).st_mtime_ns
+        except OSError:
+            return _tree_size(settings_dir)
+
+        try:
+            with open(info_path, "rb") as f:
+                data = json.load(f)
+            if (
+                data.get("version") == self.INFO_VERSION
+                and data["settings_mtime_ns"] == settings_mtime
+            ):
+                return int(data["size_bytes"])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable backup info {info_path}: {e}")
+
+        size = _tree_size(settings_dir)
+        if not record or _parse_backup_timestamp(os.path.basename(self.path)) is None:
+            return size
+
+        tmp = f"{info_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": self.INFO_VERSION,
+                        "settings_mtime_ns": settings_mtime,
+                        "size_bytes": size,
+                    },
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp, info_path)
+        except OSError as e:
+            logger.debug(f"Failed to write backup info {info_path}: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        return size
 
     @classmethod
     def from_backup_path(cls, backup_path: Path) -> BackupInfo:
@@ -112,38 +316,34 @@ class BackupInfo:
         Example:
             >>> path = Path("backups/backup_123456")
             >>> if info := BackupInfo.from_backup_path(path):
-            ...     print(f"Valid backup of {info.size_mb:.1f}MB")
+            ...     print(f"Valid backup of {info.size():.1f}MB")
             ... else:
             ...     print("Invalid backup directory")
         """
-        if not backup_path.exists():
-            raise ValueError(f"Backup not found: {backup_path}")
-            
+        # One read of the settings directory answers both existence
+        # checks, the settings count and the special directory checks;
+        # is_dir() comes from the directory entry without another stat
         settings_dir = backup_path / ".obsidian"
-        if not settings_dir.exists():
+        try:
+            with os.scandir(settings_dir) as entries:
+                names = {entry.name: entry.is_dir() for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            if not backup_path.exists():
+                raise ValueError(f"Backup not found: {backup_path}")
             raise ValueError(f"No settings found in backup: {backup_path}")
             
         # Get backup timestamp from directory name
-        try:
-            timestamp = float(backup_path.name.split("_")[1])
-        except (IndexError, ValueError):
+        timestamp = _parse_backup_timestamp(backup_path.name)
+        if timestamp is None:
             timestamp = backup_path.stat().st_mtime
             
         # Count settings files
-        settings_count = len(list(settings_dir.glob("*.json")))
+        settings_count = sum(1 for name in names if name.endswith(".json"))
         
         # Check for special directories
-        has_plugins = (settings_dir / "plugins").exists()
-        has_themes = (settings_dir / "themes").exists()
-        has_icons = (settings_dir / "icons").exists()
-        
-        # Calculate total size
-        total_size = sum(
-            f.stat().st_size
-            for f in backup_path.rglob("*")
-            if f.is_file()
-        )
-        size_mb = total_size / (1024 * 1024)  # Convert to MB
+        has_plugins = names.get("plugins", False)
+        has_themes = names.get("themes", False)
+        has_icons = names.get("icons", False)
         
         return cls(
             path=backup_path,
@@ -152,7 +352,6 @@ class BackupInfo:
             has_plugins=has_plugins,
             has_themes=has_themes,
             has_icons=has_icons,
-            size_mb=size_mb
         )
 
     def __str__(self) -> str:
@@ -181,11 +380,12 @@ class BackupInfo:
         return "\n".join([
             f"Backup from: {timestamp}",
             f"Location: {self.path}",
-            f"Settings: {self.settings_count} files ({self.size_mb:.1f}MB)",
+            f"Settings: {self.settings_count} files ({self.size():.1f}MB)",
             f"Contents: {', '.join(contents) if contents else 'settings only'}"
         ])
 
 
+
 class BackupManager:
     """Manages backups of Obsidian vault settings.
     
@@ -228,7 +428,7 @@ class BackupManager:
         >>> 
         >>> # List backups
         >>> for backup in backup_mgr.list_backups():
-        ...     print(f"{backup.timestamp}: {backup.size_mb:.1f}MB")
+        ...     print(f"{backup.timestamp}: {backup.size():.1f}MB")
         >>> 
         >>> # Restore backup
         >>> if backup_mgr.restore_backup():
@@ -236,34 +436,79 @@ class BackupManager:
     """
     
     # Core settings files that must be backed up
-    CORE_SETTINGS = {
+    CORE_SETTINGS = frozenset({
         "app.json",
         "appearance.json",
         "hotkeys.json",
         "types.json",
         "templates.json",
-    }
+    })
     
     # Plugin configuration files
-    PLUGIN_SETTINGS = {
+    PLUGIN_SETTINGS = frozenset({
         "core-plugins.json",
         "community-plugins.json",
         "core-plugins-migration.json",
-    }
+    })
     
     # Resource directories
-    RESOURCE_DIRS = {
+    RESOURCE_DIRS = frozenset({
         "plugins",
         "themes",
         "snippets",
         "icons",
-    }
+    })
+
+    # Every entry verification knows about, for a single membership test
+    KNOWN_SETTINGS = CORE_SETTINGS | PLUGIN_SETTINGS | RESOURCE_DIRS
+
+    # Transient top-level entries left out of backups by default: mobile
+    # pane layout and deleted-file trash are rewritten constantly and are
+    # never worth restoring
+    BACKUP_EXCLUDE = frozenset({
+        "workspace-mobile.json",
+        ".trash",
+    })
+
+    # Coarsest directory mtime resolution we expect (FAT/exFAT use 2 s).
+    # Listings taken this soon after backup_dir changed are not cached,
+    # since a further change might not move its mtime.
+    LIST_CACHE_SETTLE_NS = 2_000_000_000
+
+    # Suffix for expired backups waiting to be deleted in the background
+    TRASH_SUFFIX = ".todelete"
+
+    # Most expired backups deleted at once; each rmtree is a stream of
+    # unlink calls the kernel can service concurrently across trees
+    MAX_DELETE_WORKERS = 8
+
+    # Nested paths checked per backup when full verification is off
+    VERIFY_SAMPLE_SIZE = 16
+
+    # Siblings of .obsidian used while a restore swaps directories
+    RESTORE_STAGING_SUFFIX = ".restoring"
+    RESTORE_OLD_SUFFIX = ".old"
+
+    # Content store shared by deduplicated backups, inside backup_dir
+    OBJECTS_DIR = "_objects"
+
+    # Attempts to link a stored object before copying the file instead
+    DEDUPE_LINK_ATTEMPTS = 3
+
+    # Per-file stats and object names from the last deduplicated backup,
+    # inside backup_dir
+    MANIFEST_FILE = ".manifest.json"
+    MANIFEST_VERSION = 1
 
     def __init__(
         self,
         vault_path: Union[str, Path],
         backup_dir: Optional[Union[str, Path]] = None,
         max_backups: int = 5,
+        verify_backups: bool = False,
+        max_workers: Optional[int] = None,
+        dedupe: bool = False,
+        exclude: Optional[Iterable[str]] = None,
     ) -> None:
         """Initialize the backup manager.
         
@@ -272,9 +517,21 @@ class BackupManager:
             backup_dir: Optional custom backup directory path.
                        If not provided, uses .obsyncit/backups in vault.
             max_backups: Maximum number of backups to keep (default: 5)
+            verify_backups: Check every copied path after a backup or
+                           restore instead of the top level plus a random
+                           sample (default: False)
+            max_workers: Threads used to copy files during backup and
+                        restore (default: fileops.MAX_COPY_WORKERS, which
+                        scales with the CPU count)
+            dedupe: Store each file's content once under
+                   backup_dir/_objects and hardlink it into every backup
+                   that contains it unchanged (default: False)
+            exclude: Names of top-level settings entries to leave out of
+                    backups (default: BACKUP_EXCLUDE). A restore keeps
+                    the live copies of these entries.
         
         Raises:
-            ValueError: If max_backups is less than 1
+            ValueError: If max_backups or max_workers is less than 1
         
         Example:
             >>> # Basic initialization
@@ -289,6 +546,8 @@ class BackupManager:
         """
         if max_backups < 1:
             raise ValueError("max_backups must be at least 1")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
             
         self.vault_path = Path(vault_path).resolve()
         self.settings_dir = self.vault_path / ".obsidian"
@@ -300,15 +559,57 @@ class BackupManager:
             self.backup_dir = self.vault_path / ".obsyncit" / "backups"
             
         self.max_backups = max_backups
+        self.verify_backups = verify_backups
+        self.max_workers = max_workers
+        self.dedupe = dedupe
+        self.exclude: AbstractSet[str] = (
+            self.BACKUP_EXCLUDE if exclude is None else frozenset(exclude)
+        )
+        self.objects_dir = self.backup_dir / self.OBJECTS_DIR
+        self.manifest_path = self.backup_dir / self.MANIFEST_FILE
+
+        # stat results shared by the helpers of one public call
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+
+        # Backups on another filesystem (e.g. an external drive) can't be
+        # cloned, so they are copied with an external tool instead
+        self._cross_device = not same_filesystem(self.settings_dir, self.backup_dir)
+
+        # (backup_dir st_mtime_ns, backups) from the last list_backups() scan
+        self._backup_cache: Optional[Tuple[int, List[BackupInfo]]] = None
+        self._backup_cache_lock = threading.Lock()
+
+        # Timestamp of the last backup name handed out, to keep names ordered
+        self._last_backup_ns = 0
+
+        # Deletes expired backups off the caller's thread
+        self._gc_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="obsyncit-backup-gc"
+        )
+        self._purge_trash()
 
-    def create_backup(self) -> BackupInfo:
+    def create_backup(self, full_backup: bool = False) -> BackupInfo:
         """Create a backup of the vault settings.
         
         This method creates a complete backup of the vault's settings:
         1. Creates a timestamped backup directory
-        2. Copies all settings files and directories
-        3. Verifies backup integrity
-        4. Cleans up old backups if needed
+        2. Copies all settings files and directories (as reflink clones
+           on copy-on-write filesystems, or as hardlinks into the object
+           store when dedupe is enabled)
+        3. Verifies backup integrity (fully if verify_backups is set,
+           otherwise the top level plus a random sample)
+        4. Records the files' stats in the manifest (dedupe only)
+        5. Cleans up old backups if needed
+        
+        With dedupe enabled, backups are incremental: files whose mtime,
+        size, inode and mode match the manifest from the previous backup
+        are linked to their stored object without being read again, so
+        only changed files are hashed and copied.
+        
+        Args:
+            full_backup: Hash every file even if the manifest says it is
+                        unchanged (default: False). Has no effect without
+                        dedupe, where every backup is a full copy.
         
         Returns:
             BackupInfo object with metadata about the backup
@@ -324,72 +625,413 @@ class BackupManager:
             >>> if info.has_plugins:
             ...     print("Plugins backed up")
         """
-        try:
-            # Create backup directory
-            timestamp = int(time.time())
-            backup_dir = self.backup_dir / f"backup_{timestamp}"
+        self._stat_cache.clear()
+        with self._wrap_errors("Failed to create backup", errors=(Exception,)):
+            backup_dir = self._new_backup_dir()
             backup_settings = backup_dir / ".obsidian"
-            
-            # Ensure backup directory exists
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Copy settings directory
-            try:
-                shutil.copytree(
-                    self.settings_dir,
-                    backup_settings,
-                    dirs_exist_ok=True
-                )
-            except Exception as e:
-                logger.error(f"Failed to copy settings: {e}")
-                raise BackupError(
-                    "Failed to copy settings",
-                    vault_path=self.vault_path,
-                    backup_path=backup_dir,
-                )
-            
-            # Verify backup
-            try:
-                self._verify_backup(backup_settings)
-            except BackupError as e:
-                # Clean up failed backup
-                shutil.rmtree(backup_dir, ignore_errors=True)
-                raise
-            
-            # Get backup info
-            try:
+
+            # Copy and verify the settings, removing a partial backup
+            manifest: Optional[Dict[str, List[Any]]] = None
+            with self._wrap_errors(
+                "Failed to copy settings", backup_dir, cleanup=backup_dir
+            ):
+                if self.dedupe:
+                    previous = {} if full_backup else self._read_manifest()
+                    manifest = {}
+                    copied = self._link_tree(
+                        self.settings_dir, backup_settings, previous, manifest
+                    )
+                else:
+                    copied = self._copy_tree(
+                        self.settings_dir, backup_settings, self.exclude
+                    )
+                self._verify_backup(backup_settings, self._paths_to_verify(copied))
+
+            if manifest is not None:
+                self._write_manifest(manifest)
+
+            with self._wrap_errors(
+                "Failed to create backup info", backup_dir, errors=(ValueError,)
+            ):
                 backup_info = BackupInfo.from_backup_path(backup_dir)
-            except ValueError as e:
-                logger.error(f"Failed to get backup info: {e}")
-                raise BackupError(
-                    "Failed to create backup info",
-                    backup_path=backup_dir,
-                )
-            
+
             # Clean up old backups
             self._cleanup_old_backups()
-            
-            logger.info(f"Created backup:\n{backup_info}")
+
+            # Only the path: str(backup_info) would measure the backup
+            logger.info(f"Created backup: {backup_dir}")
             return backup_info
-            
-        except Exception as e:
-            if isinstance(e, BackupError):
-                raise
+
+    def _new_backup_dir(self) -> Path:
+        """Create an empty, uniquely named backup directory.
+
+        Names carry nanoseconds and mkdir must create a new directory, so
+        two backups in the same second (or clock tick) never merge into
+        one. Names never go backwards within this manager, even if the
+        wall clock is stepped back, so cleanup can't mistake the newest
+        backup for the oldest.
+
+        Returns:
+            Path of the new backup directory
+
+        Raises:
+            OSError: If the directory cannot be created
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        ns = max(time.time_ns(), self._last_backup_ns + 1)
+        while True:
+            backup_dir = self.backup_dir / _backup_name(ns)
+            try:
+                backup_dir.mkdir()
+                break
+            except FileExistsError:
+                ns += 1
+        self._last_backup_ns = ns
+        self._invalidate_backup_cache()
+        return backup_dir
+
+    @contextmanager
+    def _wrap_errors(
+        self,
+        message: str,
+        backup_path: Optional[Path] = None,
+        cleanup: Optional[Path] = None,
+        errors: Tuple[Type[BaseException], ...] = (OSError,),
+    ) -> Generator[None, None, None]:
+        """Context manager turning failures of a backup step into BackupError.
+
+        BackupErrors raised inside (for example by _verify_backup) already
+        describe the failure and pass through unchanged.
+
+        Args:
+            message: Error message for the BackupError
+            backup_path: Backup the step was working on
+            cleanup: Directory to remove if the step fails
+            errors: Exception types to convert (default: OSError)
+
+        Yields:
+            None
+
+        Raises:
+            BackupError: If the step raises one of errors or a BackupError
+
+        Example:
+            >>> with self._wrap_errors("Failed to copy settings", backup_dir):
+            ...     self._copy_tree(self.settings_dir, backup_dir / ".obsidian")
+        """
+        try:
+            yield
+        except BackupError:
+            if cleanup is not None:
+                shutil.rmtree(cleanup, ignore_errors=True)
+            raise
+        except errors as e:
+            logger.error(f"{message}: {e}")
+            if cleanup is not None:
+                shutil.rmtree(cleanup, ignore_errors=True)
             raise BackupError(
-                "Failed to create backup",
+                message,
                 vault_path=self.vault_path,
+                backup_path=backup_path,
+                details=[str(e)],
             ) from e
 
-    def _verify_backup(self, backup_dir: Path) -> None:
+    def _cached_stat(self, path: Path) -> Optional[os.stat_result]:
+        """stat a path once per public call.
+
+        Restoring checks the same backup paths from several helpers; the
+        cache is cleared at the start of create_backup and restore_backup
+        so results never outlive the call that produced them.
+
+        Args:
+            path: Path to stat
+
+        Returns:
+            The stat result (following symlinks, like Path.exists), or
+            None if the path does not exist
+        """
+        key = os.fspath(path)
+        try:
+            return self._stat_cache[key]
+        except KeyError:
+            pass
+        try:
+            result: Optional[os.stat_result] = os.stat(key)
+        except FileNotFoundError:
+            result = None
+        self._stat_cache[key] = result
+        return result
+
+    def _is_dir(self, path: Path) -> bool:
+        """Check with the stat cache whether a path is a directory."""
+        st = self._cached_stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def _copy_tree(
+        self, src: Path, dst: Path, exclude: AbstractSet[str] = frozenset()
+    ) -> List[str]:
+        """Copy a settings tree between the vault and the backup directory.
+
+        Within one filesystem, files are cloned (or copied in-kernel) by a
+        pool of max_workers threads. Across filesystems, the tree goes through a tar
+        pipeline, falling back to the thread pool if that fails. On
+        Windows every copy goes through robocopy with max_workers threads,
+        since there is nothing to clone and Python's per-file copies are
+        slow on NTFS.
+
+        Args:
+            src: Directory to copy
+            dst: Destination directory
+            exclude: Names of top-level entries to leave out
+
+        Returns:
+            Relative paths of everything copied, for _verify_backup
+
+        Raises:
+            OSError: If the copy fails
+        """
+        if self._cross_device or sys.platform == "win32":
+            return pipe_copytree(
+                src, dst, copy_function=fast_copy2, max_workers=self.max_workers,
+                exclude=exclude,
+            )
+        return parallel_copytree(
+            src, dst, copy_function=clone_copy2, max_workers=self.max_workers,
+            exclude=exclude,
+        )
+
+    def _link_tree(
+        self,
+        src: Path,
+        dst: Path,
+        previous: Dict[str, List[Any]],
+        manifest: Dict[str, List[Any]],
+    ) -> List[str]:
+        """Copy a settings tree into a backup through the object store.
+
+        Directories are created as usual, but each file is stored once in
+        objects_dir under a name derived from its content and metadata and
+        hardlinked into the backup, so files that have not changed since an
+        earlier backup cost a hash and a link instead of a copy, or just a
+        link if the previous manifest already vouches for them.
+
+        Args:
+            src: Settings directory to back up
+            dst: The new backup's settings directory
+            previous: Manifest entries from the last backup, by relative path
+            manifest: Filled in with an entry for every file linked
+
+        Returns:
+            Relative paths of everything copied, for _verify_backup
+
+        Raises:
+            OSError: If the copy fails
+        """
+        self.objects_dir.mkdir(exist_ok=True)
+        link = partial(
+            self._link_object,
+            root_len=len(os.fspath(src)) + len(os.sep),
+            previous=previous,
+            manifest=manifest,
+        )
+        return parallel_copytree(
+            src, dst, copy_function=link, max_workers=self.max_workers,
+            exclude=self.exclude,
+        )
+
+    def _link_object(
+        self,
+        src: str,
+        dst: str,
+        root_len: int = 0,
+        previous: Optional[Dict[str, List[Any]]] = None,
+        manifest: Optional[Dict[str, List[Any]]] = None,
+    ) -> str:
+        """Hardlink a file's stored content into a backup, storing it if new.
+
+        Hardlinks share one inode, so the object name covers the mode bits
+        and mtime as well as the BLAKE2b digest: two files only share an
+        object when a restore would give them identical metadata too. New
+        objects are written to a temporary name and renamed into place, so
+        a published object is always complete. If the source changes while
+        it is being stored, the copy goes to the backup alone.
+
+        Args:
+            src: File in the settings tree
+            dst: Destination path in the backup
+            root_len: Length of the settings tree's path prefix, which is
+                     cut from src to get its manifest key
+            previous: Manifest entries from the last backup; a file whose
+                     stats match its entry is linked without hashing
+            manifest: Receives an entry for the file once it is linked
+
+        Returns:
+            The destination path
+        """
+        st = os.stat(src)
+        rel = src[root_len:]
+        stats = [st.st_mtime_ns, st.st_size, st.st_ino, st.st_mode]
+        prefix = os.fspath(self.objects_dir) + os.sep
+
+        known = previous.get(rel) if previous else None
+        if known is not None and known[:4] == stats:
+            try:
+                os.link(prefix + known[4], dst)
+                if manifest is not None:
+                    manifest[rel] = known
+                return dst
+            except OSError:
+                # Pruned since, or not linkable: take the hashing path
+                pass
+
+        name = (
+            f"{file_digest(src).hex()}-{st.st_mtime_ns}-{stat.S_IMODE(st.st_mode):o}"
+        )
+        obj = prefix + name
+        for _ in range(self.DEDUPE_LINK_ATTEMPTS):
+            try:
+                os.link(obj, dst)
+                if manifest is not None:
+                    manifest[rel] = stats + [name]
+                return dst
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                if e.errno not in _LINK_UNSUPPORTED:
+                    raise
+                break
+
+            # Not stored yet, or pruned since: store it and link again
+            tmp = f"{obj}.{os.getpid()}.{threading.get_ident()}.tmp"
+            clone_copy2(src, tmp)
+            now = os.stat(src)
+            if (now.st_size, now.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+                os.replace(tmp, dst)
+                return dst
+            os.replace(tmp, obj)
+
+        clone_copy2(src, dst)
+        return dst
+
+    def _read_manifest(self) -> Dict[str, List[Any]]:
+        """Load the file stats recorded by the last deduplicated backup.
+
+        Returns:
+            Entries of [mtime_ns, size, inode, mode, object name] keyed by
+            path relative to the settings directory; empty if there is no
+            usable manifest
+        """
+        try:
+            with open(self.manifest_path, "rb") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable backup manifest: {e}")
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.MANIFEST_VERSION:
+            return {}
+        files = data.get("files")
+        if not isinstance(files, dict):
+            logger.warning("Ignoring backup manifest without a file table")
+            return {}
+        return cast(Dict[str, List[Any]], files)
+
+    def _write_manifest(self, files: Dict[str, List[Any]]) -> None:
+        """Replace the manifest atomically with a new backup's file stats.
+
+        A failure only costs the next backup its shortcut, so it is logged
+        rather than raised.
+
+        Args:
+            files: Entries collected by _link_object
+        """
+        tmp = self.manifest_path.with_name(
+            f"{self.MANIFEST_FILE}.{os.getpid()}.tmp"
+        )
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.MANIFEST_VERSION, "files": files},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to write backup manifest: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def _prune_objects(self) -> None:
+        """Delete stored objects no backup links to any more.
+
+        An object whose link count has dropped to one is referenced only by
+        the store itself. Runs on the background executor after expired
+        backups have been deleted; a backup linking an object while it is
+        pruned just stores it again.
+        """
+        try:
+            with os.scandir(self.objects_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".tmp"):
+                        continue
+                    try:
+                        if entry.stat(follow_symlinks=False).st_nlink <= 1:
+                            os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+        except OSError:
+            return
+
+    def _paths_to_verify(self, copied: Sequence[str]) -> Sequence[str]:
+        """Choose which copied paths to check after a copy.
+
+        The copy already raises on any failed file, so verification is a
+        cheap sanity check by default: every top-level entry (which covers
+        all core settings, plugin settings and resource directories) plus
+        VERIFY_SAMPLE_SIZE random nested paths. With verify_backups
+        enabled, every copied path is checked.
+
+        Args:
+            copied: Relative paths reported by the copy
+
+        Returns:
+            The relative paths to pass to _verify_backup
+        """
+        if self.verify_backups:
+            return copied
+        top_level = [rel for rel in copied if os.sep not in rel]
+        nested = [rel for rel in copied if os.sep in rel]
+        return top_level + random.sample(
+            nested, min(self.VERIFY_SAMPLE_SIZE, len(nested))
+        )
+
+    def _verify_backup(
+        self,
+        backup_dir: Path,
+        expected_paths: Optional[Sequence[str]] = None,
+    ) -> None:
         """Verify backup integrity.
         
         This method performs comprehensive verification of a backup:
         1. Checks all core settings files were backed up
         2. Verifies plugin settings and data
         3. Confirms resource directories were copied
+        4. Confirms every other copied path is present
+        
+        When the inventory produced by the copy is passed in, its top-level
+        entries are checked against one listing of backup_dir and each
+        nested path with a single lstat; neither tree is walked again.
+        Without it, the top level of the source settings is scanned and
+        only the known settings files and directories are checked.
         
         Args:
             backup_dir: Path to the backup's .obsidian directory
+            expected_paths: Optional paths, relative to backup_dir, that the
+                           copy reported creating
             
         Raises:
             BackupError: If any required files or directories are missing
@@ -397,19 +1039,46 @@ class BackupManager:
         Example:
             >>> backup_dir = Path("backups/backup_123456/.obsidian")
             >>> try:
-            ...     backup_mgr._verify_backup(backup_dir)
+            ...     copied = parallel_copytree(settings_dir, backup_dir)
+            ...     backup_mgr._verify_backup(backup_dir, copied)
             ...     print("Backup verified successfully")
             ... except BackupError as e:
             ...     print(f"Verification failed: {e}")
             ...     if e.details:
             ...         print(f"Missing: {e.details}")
         """
+        # Plain string joins avoid building a Path per entry
+        backup_prefix = os.fspath(backup_dir) + os.sep
+
+        if expected_paths is None:
+            try:
+                with os.scandir(self.settings_dir) as entries:
+                    known = self.KNOWN_SETTINGS
+                    expected_paths = [
+                        entry.name for entry in entries if entry.name in known
+                    ]
+            except FileNotFoundError:
+                expected_paths = []
+
+        # Top-level entries are checked against one listing of backup_dir;
+        # only nested paths cost an lstat each
+        try:
+            with os.scandir(backup_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        missing: Set[str] = {
+            rel for rel in expected_paths
+            if (
+                rel not in present if os.sep not in rel
+                else not os.path.lexists(backup_prefix + rel)
+            )
+        }
+        if not missing:
+            return
+
         # Check core settings
-        missing_settings = [
-            f for f in self.CORE_SETTINGS
-            if (self.settings_dir / f).exists()
-            and not (backup_dir / f).exists()
-        ]
+        missing_settings = sorted(missing & self.CORE_SETTINGS)
         if missing_settings:
             raise BackupError(
                 "Missing core settings in backup",
@@ -418,11 +1087,7 @@ class BackupManager:
             )
             
         # Check plugin files
-        missing_plugins = [
-            f for f in self.PLUGIN_SETTINGS
-            if (self.settings_dir / f).exists()
-            and not (backup_dir / f).exists()
-        ]
+        missing_plugins = sorted(missing & self.PLUGIN_SETTINGS)
         if missing_plugins:
             raise BackupError(
                 "Missing plugin settings in backup",
@@ -431,11 +1096,7 @@ class BackupManager:
             )
             
         # Check resource directories
-        missing_dirs = [
-            d for d in self.RESOURCE_DIRS
-            if (self.settings_dir / d).exists()
-            and not (backup_dir / d).exists()
-        ]
+        missing_dirs = sorted(missing & self.RESOURCE_DIRS)
         if missing_dirs:
             raise BackupError(
                 "Missing resource directories in backup",
@@ -443,6 +1104,13 @@ class BackupManager:
                 details=f"Missing: {', '.join(missing_dirs)}"
             )
 
+        # Anything else the copy reported but is not there
+        raise BackupError(
+            "Missing files in backup",
+            backup_path=backup_dir,
+            details=f"Missing: {', '.join(sorted(missing))}"
+        )
+
     def restore_backup(
         self, backup_path: Optional[Path | str] = None
     ) -> BackupInfo:
@@ -450,11 +1118,15 @@ class BackupManager:
 
         This method performs a complete restoration of settings:
         1. Validates the backup integrity
-        2. Creates safety backup of current settings
-        3. Restores all settings files
-        4. Restores plugins and their data
-        5. Restores themes and snippets
-        6. Restores plugin icons and resources
+        2. Copies the backup to a staging directory beside the settings
+        3. Verifies the staged copy
+        4. Swaps it in for the current settings with two renames, the
+           first of which moves the current settings into a new backup
+
+        The current settings are left untouched if copying or verifying
+        the backup fails. When the backup directory is on another
+        filesystem, where the current settings can't be renamed into it,
+        the safety backup is copied with create_backup() up front instead.
 
         Args:
             backup_path: Optional specific backup to restore from.
@@ -477,7 +1149,12 @@ class BackupManager:
             >>> if info := backup_mgr.restore_backup(path):
             ...     print(f"Restored backup from {path}")
         """
-        try:
+        self._stat_cache.clear()
+        with self._wrap_errors(
+            "Failed to restore backup",
+            backup_path or self.backup_dir,
+            errors=(Exception,),
+        ):
             # Get backup to restore
             backup_to_restore = self._get_backup_path(backup_path)
             if not backup_to_restore:
@@ -486,71 +1163,211 @@ class BackupManager:
                     backup_path=backup_path or self.backup_dir,
                 )
 
-            # Get backup info
-            try:
+            with self._wrap_errors(
+                "Invalid backup format", backup_to_restore, errors=(Exception,)
+            ):
                 backup_info = BackupInfo.from_backup_path(backup_to_restore)
-            except Exception as e:
-                logger.error(f"Failed to get backup info: {e}")
-                raise BackupError("Invalid backup format", backup_path=backup_to_restore)
 
             # Verify backup structure
             backup_settings = backup_to_restore / ".obsidian"
-            if not backup_settings.exists():
+            if not self._is_dir(backup_settings):
                 raise BackupError(
                     "Invalid backup - no settings found",
                     backup_path=backup_to_restore,
                 )
 
-            # Create safety backup
-            if self.settings_dir.exists():
-                try:
-                    self.create_backup()
-                except Exception as e:
-                    logger.warning(f"Failed to backup current settings before restore: {e}")
-                    # Continue with restore
+            # Create safety backup. On one filesystem the swap below moves
+            # the current settings into a backup, so nothing is copied
+            has_settings = self._is_dir(self.settings_dir)
+            snapshot_in_swap = has_settings and not self._cross_device
+            if has_settings and not snapshot_in_swap:
+                self._backup_before_restore()
 
-            # Prepare for restore
-            if self.settings_dir.exists():
-                try:
-                    shutil.rmtree(self.settings_dir)
-                except Exception as e:
-                    logger.error(f"Failed to remove existing settings: {e}")
-                    raise BackupError(
-                        "Failed to prepare for restore", 
-                        backup_path=backup_to_restore
-                    )
+            # Copy the backup next to the live settings first, so a failed
+            # copy never leaves the vault without a settings directory
+            staging = self.settings_dir.with_name(
+                self.settings_dir.name + self.RESTORE_STAGING_SUFFIX
+            )
+            with self._wrap_errors(
+                "Failed to restore backup", backup_to_restore, cleanup=staging
+            ):
+                if staging.exists():
+                    shutil.rmtree(staging)
+                restored = self._copy_tree(backup_settings, staging)
 
-            # Perform restore
-            try:
-                # Restore all settings
-                shutil.copytree(backup_settings, self.settings_dir)
-                
-                # Verify critical files were restored
-                self._verify_backup(self.settings_dir)
-                
-            except Exception as e:
-                logger.error(f"Failed to restore settings: {e}")
-                # Try to recreate empty settings directory
-                try:
-                    if not self.settings_dir.exists():
-                        self.settings_dir.mkdir(parents=True)
-                except Exception:
-                    pass  # Ignore recreation errors
-                raise BackupError(
-                    "Failed to restore backup", 
-                    backup_path=backup_to_restore
-                )
+                # Verify everything the copy reported was restored
+                self._verify_backup(staging, self._paths_to_verify(restored))
+                self._carry_over_excluded(staging)
+
+            # Swap the restored copy in with two renames
+            with self._wrap_errors(
+                "Failed to prepare for restore", backup_to_restore, cleanup=staging
+            ):
+                self._swap_in_settings(staging, snapshot=snapshot_in_swap)
 
-            logger.info(f"Restored settings from backup:\n{backup_info}")
+            logger.info(f"Restored settings from backup: {backup_to_restore}")
             return backup_info
 
+    def _backup_before_restore(self) -> None:
+        """Copy the current settings into a safety backup before a restore.
+
+        A failed backup is logged and the restore continues.
+        """
+        try:
+            self.create_backup()
         except Exception as e:
-            if isinstance(e, BackupError):
-                raise
-            raise BackupError(
-                "Failed to restore backup",
-                backup_path=backup_path or self.backup_dir,
-            ) from e
+            logger.warning(f"Failed to backup current settings before restore: {e}")
+
+    def _settings_inventory(self, full: bool = False) -> List[str]:
+        """List the live settings the way a copy would report them.
+
+        Args:
+            full: Include every nested path, not just top-level entries
+
+        Returns:
+            Paths relative to settings_dir, leaving out excluded entries
+        """
+        paths: List[str] = []
+        with os.scandir(self.settings_dir) as entries:
+            top_level = [entry for entry in entries if entry.name not in self.exclude]
+        prefix_len = len(os.fspath(self.settings_dir)) + len(os.sep)
+        for entry in top_level:
+            paths.append(entry.name)
+            if full and entry.is_dir(follow_symlinks=False):
+                for root, dirs, files in os.walk(entry.path):
+                    rel_root = root[prefix_len:]
+                    paths.extend(os.path.join(rel_root, name) for name in dirs + files)
+        return paths
+
+    def _strip_excluded(self, settings: Path) -> None:
+        """Remove excluded entries from a backup's settings directory.
+
+        Used on the pre-restore snapshot, which is the old live settings
+        directory renamed whole and so still holds them. Failures are
+        logged; the entries only cost space.
+
+        Args:
+            settings: The backup's .obsidian directory
+        """
+        for name in self.exclude:
+            path = os.path.join(settings, name)
+            try:
+                if os.path.isdir(path) and not os.path.islink(path):
+                    fast_rmtree(path)
+                else:
+                    os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove {path} from backup: {e}")
+
+    def _carry_over_excluded(self, staging: Path) -> None:
+        """Copy excluded entries from the live settings into a restore.
+
+        Entries in exclude are never backed up, and the restore replaces
+        the whole settings directory, so without this they would be lost.
+        Entries the backup does contain (from before they were excluded)
+        are left as restored.
+
+        Args:
+            staging: Restored settings directory about to be swapped in
+
+        Raises:
+            OSError: If an entry cannot be copied
+        """
+        for name in self.exclude:
+            live = self.settings_dir / name
+            if self._cached_stat(live) is None or os.path.lexists(staging / name):
+                continue
+            if self._is_dir(live):
+                self._copy_tree(live, staging / name)
+            else:
+                clone_copy2(live, staging / name)
+
+    def _swap_in_settings(self, staging: Path, snapshot: bool = False) -> None:
+        """Replace the live settings directory with a restored copy.
+
+        The current settings are renamed aside and the staged copy is
+        renamed into place, so the settings directory is missing only
+        between two rename calls rather than for a whole copy. If the
+        second rename fails, the old settings are moved back.
+
+        With snapshot set, the current settings are renamed into a new
+        backup, which then serves as the pre-restore safety backup
+        without a single file being copied. It is made to match what
+        create_backup() would have produced: excluded entries (already
+        carried over into the restore) are removed from it, and it is
+        checked with _verify_backup against an inventory of the live
+        settings taken before the rename, covering every path with
+        verify_backups and the top level otherwise. Old backups are then
+        rotated as after create_backup(). A snapshot that fails the check
+        is logged but does not undo the restore. same_filesystem only
+        compares devices, so a bind mount or overlay can still refuse the
+        rename with EXDEV; the settings are then backed up with
+        create_backup() instead and swapped as without snapshot, and later
+        restores skip the rename. Without snapshot, the old settings are
+        deleted in the background.
+
+        Args:
+            staging: Fully restored settings directory beside settings_dir
+            snapshot: Keep the current settings as a new backup
+                     (backup_dir must be on the same filesystem)
+
+        Raises:
+            OSError: If the directories cannot be renamed
+        """
+        had_settings = self.settings_dir.exists()
+        if snapshot and had_settings:
+            inventory = self._settings_inventory(full=self.verify_backups)
+            snapshot_dir = self._new_backup_dir() / ".obsidian"
+            try:
+                os.rename(self.settings_dir, snapshot_dir)
+            except OSError as e:
+                os.rmdir(snapshot_dir.parent)
+                self._invalidate_backup_cache()
+                if e.errno != errno.EXDEV:
+                    raise
+                logger.debug(
+                    f"Cannot rename {self.settings_dir} into {self.backup_dir}, "
+                    "copying it instead"
+                )
+                self._cross_device = True
+                self._backup_before_restore()
+            else:
+                try:
+                    os.rename(staging, self.settings_dir)
+                except OSError:
+                    os.rename(snapshot_dir, self.settings_dir)
+                    os.rmdir(snapshot_dir.parent)
+                    self._invalidate_backup_cache()
+                    raise
+
+                self._strip_excluded(snapshot_dir)
+                try:
+                    self._verify_backup(snapshot_dir, inventory)
+                except BackupError as e:
+                    logger.warning(
+                        f"Backup of previous settings is incomplete: {e} {e.details}"
+                    )
+                logger.info(f"Kept previous settings as backup: {snapshot_dir.parent}")
+                self._cleanup_old_backups()
+                return
+
+        old = self.settings_dir.with_name(
+            self.settings_dir.name + self.RESTORE_OLD_SUFFIX
+        )
+        if old.exists():
+            shutil.rmtree(old)
+        if had_settings:
+            os.rename(self.settings_dir, old)
+        try:
+            os.rename(staging, self.settings_dir)
+        except OSError:
+            if had_settings:
+                os.rename(old, self.settings_dir)
+            raise
+        if had_settings:
+            self._gc_executor.submit(self._delete_trees, [old])
 
     def list_backups(self) -> Sequence[BackupInfo]:
         """List available backups.
@@ -559,6 +1376,14 @@ class BackupManager:
         with the newest first. Each backup includes detailed information
         about its contents and size.
 
+        The backup directory is read with a single scandir pass, and the
+        result is reused for as long as the directory's mtime is unchanged,
+        which any backup being added, removed or renamed (by this process
+        or another) updates. Creating or removing backups through this
+        manager also invalidates the cache explicitly. The method is safe
+        to call from several threads (a UI refreshing while a sync runs);
+        concurrent calls share a single scan.
+
         Returns:
             List of BackupInfo objects, sorted newest to oldest
             
@@ -568,33 +1393,62 @@ class BackupManager:
             >>> for b in backups:
             ...     print(f"{datetime.fromtimestamp(b.timestamp)}")
             ...     print(f"  Settings: {b.settings_count}")
-            ...     print(f"  Size: {b.size_mb:.1f}MB")
+            ...     print(f"  Size: {b.size():.1f}MB")
             ...     if b.has_plugins:
             ...         print("  Includes plugins")
         """
         try:
-            if not self.backup_dir.exists():
-                return []
+            # One scan at a time: callers arriving mid-scan wait for it and
+            # then hit the cache instead of scanning too
+            with self._backup_cache_lock:
+                try:
+                    dir_mtime_ns = os.stat(self.backup_dir).st_mtime_ns
+                except FileNotFoundError:
+                    return []
+                cached = self._backup_cache
+                if cached is not None and cached[0] == dir_mtime_ns:
+                    return list(cached[1])
 
-            backups = []
-            for path in self.backup_dir.glob("backup_*"):
                 try:
-                    backup_info = BackupInfo.from_backup_path(path)
-                    backups.append(backup_info)
-                except ValueError:
-                    logger.warning(f"Skipping invalid backup directory: {path}")
-                    continue
-
-            return sorted(
-                backups,
-                key=lambda x: x.timestamp,
-                reverse=True,
-            )
+                    with os.scandir(self.backup_dir) as entries:
+                        paths = [
+                            Path(entry.path) for entry in entries
+                            if entry.name.startswith("backup_")
+                            and not entry.name.endswith(self.TRASH_SUFFIX)
+                            and entry.is_dir(follow_symlinks=False)
+                        ]
+                except FileNotFoundError:
+                    return []
+
+                backups = []
+                for path in paths:
+                    try:
+                        backup_info = BackupInfo.from_backup_path(path)
+                        backups.append(backup_info)
+                    except ValueError:
+                        logger.warning(f"Skipping invalid backup directory: {path}")
+                        continue
+
+                # Names break ties that a float timestamp is too coarse to see
+                backups.sort(key=lambda x: (x.timestamp, x.path.name), reverse=True)
+                if time.time_ns() - dir_mtime_ns >= self.LIST_CACHE_SETTLE_NS:
+                    self._backup_cache = (dir_mtime_ns, backups)
+                else:
+                    self._backup_cache = None
+                return list(backups)
 
         except Exception as e:
             logger.error(f"Error listing backups: {e}")
             return []
 
+    def _invalidate_backup_cache(self) -> None:
+        """Forget the cached backup listing.
+
+        Called whenever a backup is added or removed so the next
+        list_backups() call rescans the backup directory.
+        """
+        self._backup_cache = None
+
     def _get_backup_path(self, backup_path: Optional[Path | str] = None) -> Optional[Path]:
         """Get the path of the backup to restore.
         
@@ -603,6 +1457,10 @@ class BackupManager:
         2. Otherwise, finds the most recent valid backup
         3. Returns None if no valid backup is found
         
+        The most recent backup is picked from one scan of the backup
+        directory names, without building a BackupInfo (and walking the
+        files) for every backup the way list_backups() does.
+        
         Args:
             backup_path: Optional specific backup to restore from
             
@@ -623,17 +1481,17 @@ class BackupManager:
             if backup_path:
                 # Use specified backup if it exists
                 backup_path = Path(backup_path)
-                if not backup_path.exists():
+                if self._cached_stat(backup_path) is None:
                     logger.error(f"Specified backup not found: {backup_path}")
                     return None
                 return backup_path
 
-            # Get latest backup
-            backups = self.list_backups()
+            # Get latest backup; names break timestamp ties as in list_backups
+            backups = self._scan_backup_ages()
             if not backups:
                 return None
 
-            return backups[0].path
+            return max(backups)[1]
 
         except Exception as e:
             logger.error(f"Error getting backup path: {e}")
@@ -643,15 +1501,20 @@ class BackupManager:
         """Remove old backups exceeding maximum count.
         
         This internal method maintains the backup directory by:
-        1. Getting a list of all backups sorted by age
-        2. Keeping the newest max_backups backups
-        3. Safely removing any older backups
-        4. Logging cleanup activities
+        1. Scanning the backup directory for backups and their ages
+        2. Selecting only the oldest backups beyond max_backups
+        3. Renaming those aside and deleting them in the background,
+           several at a time
+        4. Pruning stored objects they were the last users of
+        5. Logging cleanup activities
         
         Note:
             This is called automatically after creating new backups.
             Errors during cleanup are logged but don't stop backup
-            creation.
+            creation. Each expired backup is retired with a single rename,
+            so the caller never waits for its files to be unlinked. Ages
+            come straight from the directory names, so no BackupInfo (and
+            no walk of each backup's files) is built here.
             
         Example:
             >>> # Clean up old backups
@@ -662,15 +1525,159 @@ class BackupManager:
             >>> assert len(backups) <= backup_mgr.max_backups
         """
         try:
-            backups = self.list_backups()
-            if len(backups) > self.max_backups:
-                for old_backup in backups[self.max_backups:]:
+            backups = self._scan_backup_ages()
+            excess = len(backups) - self.max_backups
+            if excess > 0:
+                staged: List[Path] = []
+                # Only the expired tail is ordered, not the whole listing
+                for _, old_backup in heapq.nsmallest(excess, backups):
                     try:
-                        if old_backup.path.exists():
-                            shutil.rmtree(old_backup.path)
-                            logger.debug(f"Removed old backup:\n{old_backup}")
+                        retired = self._retire_backup(old_backup)
+                        if retired is not None:
+                            staged.append(retired)
+                        logger.debug("Removed old backup: {}", old_backup)
+                    except FileNotFoundError:
+                        pass
                     except Exception as e:
                         logger.warning(f"Failed to remove old backup: {e}")
+                self._invalidate_backup_cache()
+                self._gc_executor.submit(
+                    self._delete_trees, staged, self.objects_dir.is_dir()
+                )
         except Exception as e:
             logger.error(f"Error during backup cleanup: {e}")
-            # Don't raise - cleanup failure shouldn't stop backup creation
\ No newline at end of file
+            # Don't raise - cleanup failure shouldn't stop backup creation
+
+    def _scan_backup_ages(self) -> List[Tuple[float, Path]]:
+        """Find backups and their timestamps with one directory scan.
+
+        Applies the same rules as list_backups() and BackupInfo: only
+        ``backup_*`` directories holding a ``.obsidian`` directory count,
+        and the timestamp comes from the name, falling back to the
+        directory's mtime.
+
+        Returns:
+            (timestamp, path) pairs in no particular order
+        """
+        backups: List[Tuple[float, Path]] = []
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if (
+                        not entry.name.startswith("backup_")
+                        or entry.name.endswith(self.TRASH_SUFFIX)
+                        or not entry.is_dir(follow_symlinks=False)
+                        or not os.path.isdir(entry.path + os.sep + ".obsidian")
+                    ):
+                        continue
+                    timestamp = _parse_backup_timestamp(entry.name)
+                    if timestamp is None:
+                        timestamp = entry.stat().st_mtime
+                    backups.append((timestamp, Path(entry.path)))
+        except FileNotFoundError:
+            pass
+        return backups
+
+    def _retire_backup(self, backup_path: Path) -> Optional[Path]:
+        """Hide a backup from listings so it can be deleted later.
+
+        The backup is renamed to a ``.todelete`` sibling, which hides it
+        from list_backups() immediately. If the rename fails the backup
+        is removed synchronously instead.
+
+        Args:
+            backup_path: Path to the backup directory to remove
+
+        Returns:
+            The renamed directory, still to be deleted, or None if the
+            backup was already removed
+
+        Raises:
+            OSError: If the backup can be neither renamed nor removed
+        """
+        staged = backup_path.with_name(backup_path.name + self.TRASH_SUFFIX)
+        try:
+            os.rename(backup_path, staged)
+        except OSError:
+            shutil.rmtree(backup_path)
+            return None
+        return staged
+
+    def _delete_trees(
+        self, paths: Sequence[Union[str, Path]], prune: bool = False
+    ) -> None:
+        """Delete retired backups, then optionally prune the object store.
+
+        Runs on the background executor. Several trees are removed at
+        once (up to MAX_DELETE_WORKERS) since the work is all unlink
+        calls; a single tree is removed directly. Failures, including
+        paths _remove_tree refuses, are logged per tree. Pruning waits
+        for every deletion, so objects the deleted backups linked to are
+        seen with their final link counts.
+
+        Args:
+            paths: Directories to remove
+            prune: Run _prune_objects afterwards
+        """
+        if len(paths) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_DELETE_WORKERS, len(paths)),
+                thread_name_prefix="obsyncit-backup-rm",
+            ) as pool:
+                futures = {pool.submit(self._remove_tree, path): path for path in paths}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except FileNotFoundError:
+                        pass
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Failed to delete {futures[future]}: {e}")
+        else:
+            for path in paths:
+                try:
+                    self._remove_tree(path)
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Failed to delete {path}: {e}")
+        if prune:
+            self._prune_objects()
+
+    def _remove_tree(self, path: Union[str, Path]) -> None:
+        """Delete a tree this manager owns with fast_rmtree.
+
+        Only direct children of backup_dir and siblings of the settings
+        directory named after it (``.obsidian.old`` and the like) may be
+        removed, so a bad path can never take out anything else.
+
+        Args:
+            path: Directory to delete
+
+        Raises:
+            ValueError: If the path is not one this manager may delete
+            OSError: If the tree cannot be removed
+        """
+        path = os.path.abspath(path)
+        parent, name = os.path.split(path)
+        if not (
+            parent == os.fspath(self.backup_dir)
+            or (
+                parent == os.fspath(self.settings_dir.parent)
+                and name.startswith(self.settings_dir.name + ".")
+            )
+        ):
+            raise ValueError(f"Refusing to delete {path}: not a backup path")
+        fast_rmtree(path)
+
+    def _purge_trash(self) -> None:
+        """Queue deletion of backups left behind by an interrupted cleanup."""
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                leftovers = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(self.TRASH_SUFFIX)
+                ]
+        except OSError:
+            return
+        if leftovers:
+            self._gc_executor.submit(self._delete_trees, leftovers)
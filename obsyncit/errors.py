@@ -203,6 +203,40 @@ class BackupError(ObsyncError):
         self.backup_path = backup_path
 
 
+class ConfigError(ObsyncError):
+    """Exception raised for configuration errors.
+    
+    This exception is raised when a configuration file is missing,
+    cannot be read, or fails validation.
+    
+    Attributes:
+        file_path: Path to (or description of) the configuration source
+    
+    Example:
+        >>> try:
+        ...     load_config("config.toml")
+        ... except ConfigError as e:
+        ...     print(f"Bad configuration: {e.file_path}")
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        file_path: Optional[ErrorContext] = None,
+        details: Optional[List[str]] = None
+    ) -> None:
+        """Initialize configuration error.
+        
+        Args:
+            message: Human-readable error description
+            file_path: Path to (or description of) the configuration source
+            details: List of configuration error details
+        """
+        context = str(file_path) if file_path else None
+        super().__init__(message, context, details)
+        self.file_path = file_path
+
+
 class VaultError(ObsyncError):
     """Exception raised for vault-related errors.
     
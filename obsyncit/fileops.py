@@ -0,0 +1,696 @@
+"""File Operations for ObsyncIt.
+
+This module provides the low-level file copy helpers used by the backup
+and sync code paths. It handles:
+
+1. Kernel-side Copies
+   - Reflink clones (FICLONE on Linux, clonefile(2) on macOS) that share
+     extents on btrfs, XFS and APFS instead of copying data
+   - copy_file_range(2) for in-kernel copies (reflink/server-side on
+     btrfs, XFS and NFS)
+   - sendfile(2) zero-copy fallback on Linux
+
+2. Portable Fallback
+   - readinto() loop with a 1 MiB reusable buffer
+   - Sequential readahead hints (posix_fadvise) for multi-chunk files
+
+3. Metadata
+   - Permission bits and timestamps are preserved like shutil.copy2,
+     set through the open descriptor (extended attributes are not copied)
+   - BLAKE2b content digests for change detection and deduplication
+
+4. Directory Trees
+   - Parallel tree copies that overlap per-file open/close syscalls
+   - tar pipelines (robocopy on Windows) for copies between filesystems
+   - rm -rf for deleting whole trees without a per-file Python loop
+
+Example Usage:
+    >>> import shutil
+    >>> from obsyncit.fileops import fast_copy2
+    >>>
+    >>> # Copy a single file
+    >>> fast_copy2("vault/.obsidian/app.json", "backup/app.json")
+    >>>
+    >>> # Use as the copy function for a whole tree
+    >>> shutil.copytree("vault/.obsidian", "backup", copy_function=fast_copy2)
+    >>>
+    >>> # Copy a whole tree with a thread pool, keeping its inventory
+    >>> copied = parallel_copytree("vault/.obsidian", "backup/.obsidian")
+    >>>
+    >>> # Clone instead of copying where the filesystem allows it
+    >>> parallel_copytree("vault/.obsidian", "backup", copy_function=clone_copy2)
+    >>>
+    >>> # Copy to a backup drive with an external tool
+    >>> if not same_filesystem("vault/.obsidian", "/mnt/backups"):
+    ...     pipe_copytree("vault/.obsidian", "/mnt/backups/backup_1/.obsidian")
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import io
+import os
+import shutil
+import stat
+import subprocess
+import sys
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import (
+    AbstractSet, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Chunk size for the userspace fallback copy loop
+COPY_BUFSIZE = 1024 * 1024
+
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_HAS_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Whether mode and times can be set on an open descriptor (not Windows)
+_HAS_FD_METADATA = hasattr(os, "fchmod") and os.utime in os.supports_fd
+
+# Raw descriptors skip the buffered file objects open() would build
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+
+# ioctl request number for FICLONE, _IOW(0x94, 9, int), from <linux/fs.h>
+FICLONE = 0x40049409
+
+_HAS_FICLONE = fcntl is not None and sys.platform.startswith("linux")
+_HAS_CLONEFILE = sys.platform == "darwin"
+
+# Copies are I/O bound and release the GIL, so oversubscribe the CPUs
+MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Errors meaning "this strategy is unsupported here", not "the copy failed"
+_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.ENOTSOCK,
+    getattr(errno, "EOPNOTSUPP", errno.ENOSYS),
+    getattr(errno, "ENOTSUP", errno.ENOSYS),
+}
+
+# Clones also fail with ENOTTY when the filesystem has no clone ioctl
+_CLONE_FALLBACK_ERRNOS = _FALLBACK_ERRNOS | {errno.ENOTTY}
+
+# Whether cloning works between a (source, destination) device pair. Only
+# the first file copied between two filesystems pays for a failed attempt.
+_clone_support: Dict[Tuple[int, int], bool] = {}
+
+
+def _copy_file_range(infd: int, outfd: int, size: int, offset: int) -> int:
+    """Copy with copy_file_range(2), returning the offset reached."""
+    while True:
+        sent = os.copy_file_range(
+            infd, outfd, max(size - offset, COPY_BUFSIZE), offset, offset
+        )
+        if sent == 0:
+            return offset
+        offset += sent
+
+
+def _sendfile(infd: int, outfd: int, size: int, offset: int) -> int:
+    """Copy with sendfile(2), returning the offset reached."""
+    os.lseek(outfd, offset, os.SEEK_SET)
+    while True:
+        sent = os.sendfile(outfd, infd, offset, max(size - offset, COPY_BUFSIZE))
+        if sent == 0:
+            return offset
+        offset += sent
+
+
+def _copy_fd(infd: int, outfd: int, size: int) -> None:
+    """Copy an open file, preferring in-kernel copies.
+
+    Each strategy resumes from the offset the previous one reached, so a
+    strategy that gives up part-way never duplicates or skips data.
+
+    Args:
+        infd: Descriptor of the source file, open for reading
+        outfd: Descriptor of the destination file, open for writing
+        size: Size of the source file in bytes
+    """
+    offset = 0
+
+    # Files spanning several chunks are read front to back by every
+    # strategy below, so ask the kernel for aggressive readahead. Smaller
+    # files are not worth the extra syscall.
+    if _HAS_FADVISE and size > COPY_BUFSIZE:
+        try:
+            os.posix_fadvise(infd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+    if _HAS_COPY_FILE_RANGE and size:
+        try:
+            offset = _copy_file_range(infd, outfd, size, offset)
+            if offset >= size:
+                return
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+
+    if _HAS_SENDFILE and size:
+        try:
+            offset = _sendfile(infd, outfd, size, offset)
+            if offset >= size:
+                return
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+
+    with io.FileIO(infd, "rb", closefd=False) as fsrc, \
+            io.FileIO(outfd, "wb", closefd=False) as fdst:
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        buf = bytearray(COPY_BUFSIZE)
+        view = memoryview(buf)
+        while True:
+            read = fsrc.readinto(buf)
+            if not read:
+                break
+            written = 0
+            while written < read:
+                written += fdst.write(view[written:read])
+
+
+def _copy_metadata(st: os.stat_result, outfd: int, src: PathLike, dst: PathLike) -> None:
+    """Give a copied file the source's permission bits and timestamps.
+
+    Uses fchmod and futimens on the still-open destination, which saves
+    the path lookups and extended-attribute probing of shutil.copystat.
+    Platforms without descriptor support fall back to shutil.copystat.
+
+    Args:
+        st: stat result of the source file
+        outfd: Descriptor of the destination, after all writes
+        src: Path of the source file
+        dst: Path of the destination file
+    """
+    if _HAS_FD_METADATA:
+        os.fchmod(outfd, stat.S_IMODE(st.st_mode))
+        os.utime(outfd, ns=(st.st_atime_ns, st.st_mtime_ns))
+    else:
+        shutil.copystat(src, dst)
+
+
+def _open_pair(src: PathLike, dst: PathLike) -> Tuple[int, int, os.stat_result]:
+    """Open a source for reading and a destination for writing.
+
+    Args:
+        src: Path of the file to copy
+        dst: Path of the destination file, created or truncated
+
+    Returns:
+        (source descriptor, destination descriptor, source stat result)
+
+    Raises:
+        OSError: If either file cannot be opened
+    """
+    infd = os.open(src, _READ_FLAGS)
+    try:
+        st = os.fstat(infd)
+        if stat.S_ISDIR(st.st_mode):
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), src)
+        outfd = os.open(dst, _WRITE_FLAGS, 0o666)
+    except BaseException:
+        os.close(infd)
+        raise
+    return infd, outfd, st
+
+
+def fast_copy2(src: PathLike, dst: PathLike) -> PathLike:
+    """Copy a file and its metadata using the fastest available method.
+
+    This is a drop-in replacement for shutil.copy2 when the destination
+    is a file path. It tries copy_file_range(2) first, which lets the
+    kernel clone extents on copy-on-write filesystems and offload the
+    copy on NFS, then sendfile(2), then a 1 MiB userspace buffer loop.
+
+    Files are opened as raw descriptors and the mode and timestamps are
+    set on the open destination, so a small file costs two opens, one
+    fstat, the copy and two metadata calls. Extended attributes are not
+    copied; settings files don't carry any that matter.
+
+    Args:
+        src: Path of the file to copy
+        dst: Path of the destination file (not a directory)
+
+    Returns:
+        The destination path, like shutil.copy2
+
+    Raises:
+        OSError: If the file cannot be read or written
+
+    Example:
+        >>> fast_copy2("plugins/dataview/main.js", "backup/main.js")
+        'backup/main.js'
+    """
+    infd, outfd, st = _open_pair(src, dst)
+    try:
+        _copy_fd(infd, outfd, st.st_size)
+        _copy_metadata(st, outfd, src, dst)
+    finally:
+        os.close(outfd)
+        os.close(infd)
+    return dst
+
+
+def _clonefile(src: str, dst: str) -> None:
+    """Clone a file with macOS clonefile(2), which creates dst."""
+    import ctypes
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), src, None, dst)
+
+
+def clone_copy2(src: PathLike, dst: PathLike) -> PathLike:
+    """Clone a file where the filesystem supports it, else fast_copy2.
+
+    On copy-on-write filesystems (btrfs, XFS with reflink, APFS) a clone
+    shares the source's data extents, so it takes constant time and no
+    extra space until either copy is modified. Elsewhere this behaves
+    exactly like fast_copy2.
+
+    Whether cloning works is remembered per pair of devices, so on
+    filesystems without clone support only the first file pays for the
+    failed attempt.
+
+    Args:
+        src: Path of the file to copy
+        dst: Path of the destination file (not a directory)
+
+    Returns:
+        The destination path, like shutil.copy2
+
+    Raises:
+        OSError: If the file cannot be read or written
+
+    Example:
+        >>> clone_copy2("plugins/dataview/main.js", "backup/main.js")
+        'backup/main.js'
+    """
+    if _HAS_CLONEFILE:
+        key = (os.stat(src).st_dev, os.stat(os.path.dirname(dst) or ".").st_dev)
+        if _clone_support.get(key, True):
+            try:
+                _clonefile(os.fspath(src), os.fspath(dst))
+                _clone_support[key] = True
+                shutil.copystat(src, dst)
+                return dst
+            except OSError as e:
+                # EEXIST: clonefile never overwrites, so copy over it instead
+                if e.errno == errno.EEXIST:
+                    pass
+                elif e.errno in _CLONE_FALLBACK_ERRNOS:
+                    _clone_support[key] = False
+                else:
+                    raise
+        return fast_copy2(src, dst)
+
+    infd, outfd, st = _open_pair(src, dst)
+    try:
+        size = st.st_size
+        cloned = False
+        if _HAS_FICLONE and size:
+            key = (st.st_dev, os.fstat(outfd).st_dev)
+            if _clone_support.get(key, True):
+                try:
+                    fcntl.ioctl(outfd, FICLONE, infd)
+                    cloned = _clone_support[key] = True
+                except OSError as e:
+                    if e.errno not in _CLONE_FALLBACK_ERRNOS:
+                        raise
+                    _clone_support[key] = False
+        if not cloned:
+            _copy_fd(infd, outfd, size)
+        _copy_metadata(st, outfd, src, dst)
+    finally:
+        os.close(outfd)
+        os.close(infd)
+    return dst
+
+
+def file_digest(path: PathLike) -> bytes:
+    """Hash a file's contents with BLAKE2b.
+
+    Files smaller than COPY_BUFSIZE, which is nearly every settings
+    file, are hashed from a single unbuffered read. Larger files stream
+    through one reusable COPY_BUFSIZE buffer; hashlib.file_digest would
+    do the same but needs Python 3.11.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        The binary digest of the file's bytes
+
+    Raises:
+        OSError: If the file cannot be read
+
+    Example:
+        >>> file_digest("plugins/dataview/main.js").hex()
+        '5f2b...'
+    """
+    with open(path, "rb", buffering=0) as f:
+        # A 1 MiB buffer costs more to allocate and zero than a small
+        # file costs to read
+        if os.fstat(f.fileno()).st_size < COPY_BUFSIZE:
+            return hashlib.blake2b(f.readall()).digest()
+
+        digest = hashlib.blake2b()
+        buf = bytearray(COPY_BUFSIZE)
+        view = memoryview(buf)
+        while True:
+            read = f.readinto(buf)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.digest()
+
+
+class _TreeEntry(NamedTuple):
+    """A source path, its destination and its path relative to the root."""
+
+    src: str
+    dst: str
+    rel: str
+
+
+def _scan_tree(
+    src: str, dst: str, exclude: AbstractSet[str] = frozenset()
+) -> Tuple[List[_TreeEntry], List[_TreeEntry]]:
+    """Walk a tree once with scandir, pairing source and destination paths.
+
+    Symlinks are followed, matching shutil.copytree's default.
+
+    Args:
+        src: Root of the tree to copy
+        dst: Root of the destination tree
+        exclude: Names of entries directly under src to leave out
+
+    Returns:
+        Tuple of (directories, files). Directories are listed parents
+        first, starting with the root itself (whose rel is "").
+    """
+    sep = os.sep
+    dirs = [_TreeEntry(src, dst, "")]
+    files = []
+    i = 0
+    while i < len(dirs):
+        src_dir, dst_dir, rel_dir = dirs[i]
+        i += 1
+        # Plain string concatenation: this runs once per file in the tree
+        dst_prefix = dst_dir + sep
+        rel_prefix = rel_dir + sep if rel_dir else ""
+        skip = exclude if not rel_dir else ()
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in skip:
+                    continue
+                item = _TreeEntry(entry.path, dst_prefix + name, rel_prefix + name)
+                if entry.is_dir():
+                    dirs.append(item)
+                else:
+                    files.append(item)
+    return dirs, files
+
+
+def parallel_copytree(
+    src: PathLike,
+    dst: PathLike,
+    copy_function: Callable[[str, str], object] = fast_copy2,
+    max_workers: Optional[int] = None,
+    exclude: AbstractSet[str] = frozenset(),
+) -> List[str]:
+    """Recursively copy a directory tree using a thread pool.
+
+    The tree is walked once up front; directories are created
+    synchronously and file copies are then fanned out across worker
+    threads. Settings trees are mostly small plugin files, where the
+    cost is dominated by open/close syscalls rather than bandwidth, so
+    overlapping them is much faster than shutil.copytree's serial loop.
+
+    Existing destination directories are reused, like
+    shutil.copytree(..., dirs_exist_ok=True).
+
+    Args:
+        src: Directory to copy
+        dst: Destination directory
+        copy_function: Function used to copy each file (default: fast_copy2)
+        max_workers: Thread pool size (default: MAX_COPY_WORKERS)
+        exclude: Names of entries directly under src not to copy
+            (e.g. {"workspace-mobile.json"})
+
+    Returns:
+        Paths of every directory and file copied, relative to dst. The
+        walk already produced them, so callers can verify the copy
+        without traversing either tree again.
+
+    Raises:
+        OSError: The first error raised while copying; copies that have
+            not started yet are cancelled
+
+    Example:
+        >>> parallel_copytree("vault/.obsidian", "backups/backup_1/.obsidian")
+        ['plugins', 'app.json', 'plugins/dataview', 'plugins/dataview/main.js']
+    """
+    dirs, files = _scan_tree(os.fspath(src), os.fspath(dst), exclude)
+
+    for item in dirs:
+        os.makedirs(item.dst, exist_ok=True)
+
+    if files:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers or MAX_COPY_WORKERS, len(files))
+        ) as executor:
+            futures = [executor.submit(copy_function, f.src, f.dst) for f in files]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                future.result()
+
+    # Directory timestamps change as files land in them, so copy them last
+    for item in reversed(dirs):
+        shutil.copystat(item.src, item.dst)
+
+    return [item.rel for item in dirs[1:]] + [item.rel for item in files]
+
+
+def same_filesystem(a: PathLike, b: PathLike) -> bool:
+    """Check whether two paths live on the same filesystem.
+
+    Either path may not exist yet; its nearest existing ancestor is used
+    instead. If neither can be examined, the paths are assumed to share a
+    filesystem.
+
+    Args:
+        a: First path
+        b: Second path
+
+    Returns:
+        True if both paths resolve to the same device
+
+    Example:
+        >>> same_filesystem("vault/.obsidian", "vault/.obsyncit/backups")
+        True
+    """
+    def _device(path: PathLike) -> Optional[int]:
+        current = os.path.abspath(os.fspath(path))
+        while True:
+            try:
+                return os.stat(current).st_dev
+            except FileNotFoundError:
+                parent = os.path.dirname(current)
+                if parent == current:
+                    return None
+                current = parent
+            except OSError:
+                return None
+
+    dev_a, dev_b = _device(a), _device(b)
+    return dev_a is None or dev_b is None or dev_a == dev_b
+
+
+def _tar_pipe(src: str, dst: str, members: Optional[List[str]] = None) -> bool:
+    """Copy src into dst with ``tar -c | tar -x``, returning success.
+
+    members limits the copy to those top-level names; None copies all.
+    """
+    tar = shutil.which("tar")
+    if tar is None:
+        return False
+    if members is not None and not members:
+        return True
+    try:
+        # -h follows symlinks like copytree, pax keeps sub-second mtimes
+        # and -p keeps permission bits
+        producer = subprocess.Popen(
+            [tar, "-C", src, "--format=pax", "-chf", "-", "--"]
+            + (["."] if members is None else members),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        consumer = subprocess.Popen(
+            [tar, "-C", dst, "-xpf", "-"],
+            stdin=producer.stdout,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    # Let the producer see SIGPIPE if the consumer exits early
+    if producer.stdout is not None:
+        producer.stdout.close()
+    return consumer.wait() == 0 and producer.wait() == 0
+
+
+def _robocopy(
+    src: str, dst: str, excluded: Optional[List[str]] = None, threads: int = 16
+) -> bool:
+    """Copy src into dst with robocopy, returning success.
+
+    excluded lists full paths of top-level entries to leave out; threads
+    is passed to /MT (robocopy accepts 1 to 128).
+    """
+    robocopy = shutil.which("robocopy")
+    if robocopy is None:
+        return False
+    skip: List[str] = []
+    if excluded:
+        # Full paths, so only these entries match and not namesakes deeper
+        skip = ["/XF", *excluded, "/XD", *excluded]
+    try:
+        result = subprocess.run(
+            [
+                robocopy, src, dst, "/E", f"/MT:{max(1, min(threads, 128))}",
+                "/NFL", "/NDL", "/NJH", "/NJS", "/NP",
+            ]
+            + skip,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    # robocopy exit codes below 8 mean success (bit flags for what changed)
+    return result.returncode < 8
+
+
+def _rm_rf(path: str) -> bool:
+    """Remove path with ``rm -rf``, returning success."""
+    rm = shutil.which("rm")
+    if rm is None:
+        return False
+    try:
+        result = subprocess.run(
+            [rm, "-rf", "--", path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def fast_rmtree(path: PathLike) -> None:
+    """Delete a directory tree, preferring ``rm -rf`` on POSIX.
+
+    shutil.rmtree runs a Python loop of scandir, unlink and rmdir calls;
+    rm does the same walk in C, which is noticeably faster for trees of
+    hundreds of small plugin files. On Windows, or if rm is missing or
+    fails, shutil.rmtree is used, so errors still surface with details.
+
+    Args:
+        path: Directory to delete
+
+    Raises:
+        OSError: If the tree cannot be removed (FileNotFoundError if it
+            does not exist and rm was unavailable)
+
+    Example:
+        >>> fast_rmtree("backups/backup_1700000000_000000000.todelete")
+    """
+    path_str = os.fspath(path)
+    if sys.platform != "win32" and _rm_rf(path_str):
+        return
+    shutil.rmtree(path_str)
+
+
+def pipe_copytree(
+    src: PathLike,
+    dst: PathLike,
+    copy_function: Callable[[str, str], object] = fast_copy2,
+    max_workers: Optional[int] = None,
+    exclude: AbstractSet[str] = frozenset(),
+) -> List[str]:
+    """Copy a directory tree with an external copy tool.
+
+    When the source and destination are on different filesystems no
+    clone or in-kernel copy applies, so the whole tree is handed to a
+    single ``tar -c | tar -x`` pipeline (robocopy on Windows), which
+    copies without per-file Python overhead. If the tool is missing or
+    fails, the copy is redone with parallel_copytree.
+
+    On Windows this is also the fastest way to copy within one volume:
+    NTFS has no clone support to use, and robocopy's multithreaded copy
+    avoids the per-file overhead that makes Python copies slow there.
+
+    Args:
+        src: Directory to copy
+        dst: Destination directory
+        copy_function: Per-file copy function for the fallback
+        max_workers: Thread count for robocopy and the fallback pool
+            (default: MAX_COPY_WORKERS)
+        exclude: Names of entries directly under src not to copy
+
+    Returns:
+        Paths of every directory and file in the source tree, relative
+        to dst, like parallel_copytree
+
+    Raises:
+        OSError: If the fallback copy fails
+
+    Example:
+        >>> pipe_copytree("vault/.obsidian", "/mnt/backups/backup_1/.obsidian")
+        ['plugins', 'app.json', 'plugins/dataview', 'plugins/dataview/main.js']
+    """
+    src_str, dst_str = os.fspath(src), os.fspath(dst)
+    dirs, files = _scan_tree(src_str, dst_str, exclude)
+
+    os.makedirs(dst_str, exist_ok=True)
+    if sys.platform == "win32":
+        excluded = [os.path.join(src_str, name) for name in sorted(exclude)]
+        copied = _robocopy(
+            src_str, dst_str, excluded, max_workers or MAX_COPY_WORKERS
+        )
+    else:
+        members = None
+        if exclude:
+            # The scan already dropped excluded names from the top level
+            members = [
+                item.rel for item in dirs[1:] + files if os.sep not in item.rel
+            ]
+        copied = _tar_pipe(src_str, dst_str, members)
+    if copied:
+        return [item.rel for item in dirs[1:]] + [item.rel for item in files]
+
+    return parallel_copytree(
+        src, dst, copy_function=copy_function, max_workers=max_workers,
+        exclude=exclude,
+    )
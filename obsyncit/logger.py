@@ -66,7 +66,7 @@ from __future__ import annotations
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Literal, Union, Any, Dict, TypeAlias
+from typing import Optional, Literal, Union, Any, Dict, Tuple, TypeAlias
 
 from loguru import logger
 
@@ -198,6 +198,11 @@ def _add_handler(config: LoggerConfig) -> int:
     return logger.add(**config.to_dict())
 
 
+# Settings from the last setup_logging() call and the ids logger.add
+# returned for its handlers
+_configured: Optional[Tuple[Tuple[Any, ...], Tuple[int, ...]]] = None
+
+
 def setup_logging(config: Config) -> None:
     """Configure Loguru logging based on the provided configuration.
     
@@ -274,8 +279,24 @@ def setup_logging(config: Config) -> None:
         - Exception logging includes variable values by default
         - Color output is enabled for console but not file logs
         - All existing handlers are removed before configuration
+        - Calling it again with the same settings is a no-op, so a
+          second entry point doesn't open another log file
     """
+    global _configured
+
     log_config = config.logging
+    settings = (
+        log_config.log_dir,
+        log_config.level,
+        log_config.format,
+        log_config.rotation,
+        log_config.retention,
+        log_config.compression,
+        id(sys.stderr),
+    )
+    if _configured is not None and _configured[0] == settings:
+        return
+
     log_dir = Path(log_config.log_dir)
     log_dir.mkdir(exist_ok=True)
 
@@ -283,7 +304,7 @@ def setup_logging(config: Config) -> None:
     logger.remove()
 
     # Configure console logging
-    logger.add(
+    console_id = logger.add(
         sink=sys.stderr,
         level=log_config.level,
         format=log_config.format,
@@ -293,7 +314,7 @@ def setup_logging(config: Config) -> None:
     )
 
     # Configure file logging (always DEBUG level)
-    logger.add(
+    file_id = logger.add(
         sink=str(log_dir / "obsyncit_{time}.log"),
         level="DEBUG",
         format=log_config.format,
@@ -304,10 +325,20 @@ def setup_logging(config: Config) -> None:
         diagnose=True,
     )
 
-    # Log configuration details at appropriate levels
+    _configured = (settings, (console_id, file_id))
+
+    # Log configuration details at appropriate levels; the details go out
+    # as one record so the line-buffered log file takes a single write
     logger.info("Logging configured successfully")
-    logger.debug(f"Log directory: {log_dir}")
-    logger.debug(f"Console level: {log_config.level}")
-    logger.debug(f"File rotation: {log_config.rotation}")
-    logger.debug(f"File retention: {log_config.retention}")
-    logger.debug(f"File compression: {log_config.compression}")
\ No newline at end of file
+    logger.debug(
+        "Log directory: {}\n"
+        "Console level: {}\n"
+        "File rotation: {}\n"
+        "File retention: {}\n"
+        "File compression: {}",
+        log_dir,
+        log_config.level,
+        log_config.rotation,
+        log_config.retention,
+        log_config.compression,
+    )
\ No newline at end of file
@@ -35,11 +35,10 @@ import argparse
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, Optional, Sequence, NoReturn, Union
+from typing import Dict, List, Optional, Sequence, NoReturn, Tuple, Union
 
-import tomli
 from loguru import logger
-from pydantic import ValidationError as PydanticValidationError
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
 
 from obsyncit.schemas import Config
 from obsyncit.logger import setup_logging
@@ -57,6 +56,15 @@ from obsyncit.errors import (
 )
 
 
+# Built once at import so every load_config() call reuses the compiled
+# pydantic-core validator instead of re-resolving it through the model class
+_CONFIG_ADAPTER: TypeAdapter[Config] = TypeAdapter(Config)
+
+# Validated configs keyed by (resolved path, mtime_ns, size); an unchanged
+# file is served from here without re-parsing or re-validating it
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Config] = {}
+
+
 class ExitCode(Enum):
     """Exit codes for different error conditions."""
     SUCCESS = 0
@@ -223,17 +231,45 @@ def load_config(config_path: Path) -> Config:
 
     Raises:
         ConfigError: If the file doesn't exist or contains invalid configuration
+
+    Note:
+        Results are cached by the file's path, modification time and size,
+        so loading an unchanged file again skips parsing and validation.
+        Each call still returns its own deep copy, since callers apply
+        command line overrides to the returned object.
     """
-    if not config_path.exists():
+    config_path = Path(config_path)
+    try:
+        st = config_path.stat()
+    except FileNotFoundError as e:
         raise ConfigError(
             "Configuration file not found",
             f"Path: {config_path}",
-        )
+        ) from e
+    except OSError as e:
+        raise ConfigError("Error reading configuration", str(e)) from e
+
+    key = (str(config_path.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
+    # Imported lazily so runs that never read a config skip it; tomllib is
+    # the standard library's copy of tomli on Python 3.11+
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
 
     try:
         with open(config_path, "rb") as f:
-            config_data = tomli.load(f)
-        return Config.model_validate(config_data)
+            config_data = tomllib.load(f)
+        config = _CONFIG_ADAPTER.validate_python(config_data)
+    except FileNotFoundError as e:
+        raise ConfigError(
+            "Configuration file not found",
+            f"Path: {config_path}",
+        ) from e
     except PydanticValidationError as e:
         errors = [
             f"{' -> '.join(str(loc) for loc in error['loc'])}: {error['msg']}"
@@ -243,6 +279,9 @@ def load_config(config_path: Path) -> Config:
     except Exception as e:
         raise ConfigError("Error reading configuration", str(e)) from e
 
+    _CONFIG_CACHE[key] = config
+    return config.model_copy(deep=True)
+
 
 def handle_error(error: Exception) -> NoReturn:
     """Handle different types of errors with appropriate messages and exit codes.
@@ -324,7 +363,7 @@ def print_backups(backups: Sequence[BackupInfo]) -> None:
     print("\nAvailable backups:")
     for backup in backups:
         status = "(verified)" if backup.is_verified else ""
-        print(f"  {backup.timestamp} - {backup.size_mb:.1f}MB {status}")
+        print(f"  {backup.timestamp} - {backup.size(record=True):.1f}MB {status}")
 
 
 def main(args: Optional[Sequence[str]] = None) -> None:
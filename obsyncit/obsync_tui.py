@@ -27,7 +27,8 @@ import sys
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Tuple, Type, BaseException, TracebackType
+from types import TracebackType
+from typing import Optional, List, Tuple, Type
 import argparse
 
 from rich.console import Console
@@ -350,7 +351,8 @@ class ObsidianSyncTUI:
     def __init__(
         self,
         search_path: Optional[Path] = None,
-        progress_factory: Optional[type[ProgressInterface]] = None
+        progress_factory: Optional[type[ProgressInterface]] = None,
+        config: Optional[Config] = None,
     ):
         """Initialize the TUI application.
         
@@ -359,6 +361,8 @@ class ObsidianSyncTUI:
                        Defaults to user's home directory if not specified.
             progress_factory: Optional factory class for creating progress indicators.
                             Defaults to SyncProgress. Useful for testing with MockProgress.
+            config: Optional configuration already loaded by the caller.
+                   Defaults to a new Config with default settings.
         """
         self.console = Console(theme=Theme({
             "info": Style.INFO.value,
@@ -369,7 +373,7 @@ class ObsidianSyncTUI:
         # Use home directory as default search path
         default_path = Path.home()
         self.vault_discovery = VaultDiscovery(search_path or default_path)
-        self.config = Config()
+        self.config = config if config is not None else Config()
         self._progress_factory = progress_factory or SyncProgress
 
     def create_progress(self) -> ProgressInterface:
@@ -693,8 +697,10 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    setup_logging(Config())
-    tui = ObsidianSyncTUI(search_path=args.search_path)
+    # One Config serves both logging and the TUI
+    config = Config()
+    setup_logging(config)
+    tui = ObsidianSyncTUI(search_path=args.search_path, config=config)
     sys.exit(0 if tui.run() else 1)
 
 
@@ -64,7 +64,7 @@ Configuration can also be loaded from TOML files:
     ```
 """
 
-from typing import Literal
+from typing import List, Literal
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
@@ -186,6 +186,13 @@ class BackupConfig(BaseModel):
         max_backups: Maximum number of backups to retain (default: 5)
         dry_run: Whether to simulate backup operations (default: False)
         ignore_errors: Whether to continue on non-critical errors (default: False)
+        verify_backups: Whether to check every copied file is present in a new
+            backup, rather than a small random sample (default: False)
+        dedupe_backups: Whether to store unchanged files once and hardlink
+            them into each backup instead of copying them (default: False)
+        exclude: Top-level settings entries left out of backups and kept
+            from the live settings on restore
+            (default: ["workspace-mobile.json", ".trash"])
     
     Example:
         >>> config = BackupConfig(
@@ -212,6 +219,18 @@ class BackupConfig(BaseModel):
         default=False,
         description="Continue on non-critical errors"
     )
+    verify_backups: bool = Field(
+        default=False,
+        description="Verify every file in new backups instead of a sample"
+    )
+    dedupe_backups: bool = Field(
+        default=False,
+        description="Hardlink unchanged files between backups instead of copying"
+    )
+    exclude: List[str] = Field(
+        default_factory=lambda: ["workspace-mobile.json", ".trash"],
+        description="Top-level settings entries to leave out of backups"
+    )
 
     @field_validator('max_backups')
     def validate_max_backups(cls, v: int) -> int:
@@ -48,26 +48,209 @@ Example:
 from __future__ import annotations
 
 import json
+import mmap
+import os
 import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Set, Union, Dict, Any, Generator
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from typing_extensions import Protocol
 from contextlib import contextmanager
 
 from loguru import logger
 
-from obsyncit.backup import BackupManager
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+from obsyncit.backup import BackupInfo, BackupManager
 from obsyncit.errors import (
     BackupError,
     SyncError,
     ValidationError,
     ObsyncError,
 )
+from obsyncit.fileops import clone_copy2, file_digest, parallel_copytree
 from obsyncit.schemas import Config
 from obsyncit.vault import VaultManager
 
 
+# Settings files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+# Readahead hint for mapped files; mmap.madvise is missing on Windows
+_MADV_SEQUENTIAL: Optional[int] = (
+    getattr(mmap, "MADV_SEQUENTIAL", None) if hasattr(mmap.mmap, "madvise") else None
+)
+
+# Items are synced concurrently; copies are I/O bound and release the GIL
+MAX_SYNC_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+
+def _loads_json(raw: Union[bytes, memoryview]) -> Any:
+    """Parse JSON from raw bytes, using orjson when it is installed.
+
+    orjson is several times faster than the standard library parser but
+    stricter: it rejects NaN/Infinity literals and integers wider than 64
+    bits. Documents it refuses are re-parsed with the json module so the
+    accepted input is the same whichever parser is available.
+
+    Args:
+        raw: The encoded JSON document, either bytes or a view of a
+            memory-mapped file
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    # bytes() is a no-op for bytes; views must be copied for json
+    return json.loads(bytes(raw))
+
+
+def _same_stat(
+    src: Optional[os.stat_result], dst: Optional[os.stat_result]
+) -> bool:
+    """Check whether a target file already matches its source.
+
+    Files are copied with copy2, which preserves modification times, so a
+    target whose size and nanosecond mtime equal the source's was written
+    by a previous sync and has not been touched since.
+
+    Args:
+        src: stat result of the source file, or None if it is missing
+        dst: stat result of the target file, or None if it is missing
+
+    Returns:
+        True if both are regular files with the same size and nanosecond
+        mtime. A directory's mtime says nothing about the files below it,
+        so directories never compare as unchanged.
+    """
+    if src is None or dst is None:
+        return False
+    if not (stat.S_ISREG(src.st_mode) and stat.S_ISREG(dst.st_mode)):
+        return False
+    return src.st_size == dst.st_size and src.st_mtime_ns == dst.st_mtime_ns
+
+
+def _same_content(
+    source_path: Union[str, Path],
+    target_path: Union[str, Path],
+    src: Optional[os.stat_result],
+    dst: Optional[os.stat_result],
+) -> bool:
+    """Check whether two regular files hold the same bytes.
+
+    Catches files whose mtime changed without their content changing,
+    e.g. a settings file Obsidian rewrote with the same values or a vault
+    restored from a copy that did not preserve timestamps. Files of
+    different sizes are never hashed.
+
+    Args:
+        source_path: File in the source vault
+        target_path: Corresponding file in the target vault
+        src: stat result of source_path, or None if it is missing
+        dst: stat result of target_path, or None if it is missing
+
+    Returns:
+        True if both are regular files of equal size and equal digests
+    """
+    if src is None or dst is None:
+        return False
+    if not (stat.S_ISREG(src.st_mode) and stat.S_ISREG(dst.st_mode)):
+        return False
+    if src.st_size != dst.st_size:
+        return False
+    try:
+        return file_digest(source_path) == file_digest(target_path)
+    except OSError:
+        return False
+
+
+def _copy_if_changed(src: str, dst: str) -> str:
+    """clone_copy2 that leaves files already matching their source untouched.
+
+    Used as the copytree copy function for synced directories so that
+    re-syncing a theme or snippet folder only rewrites changed files.
+    Files with identical content but a different mtime only get their
+    metadata updated, so the next sync skips them on stat alone.
+    """
+    try:
+        src_st = os.stat(src)
+        dst_st = os.stat(dst)
+    except OSError:
+        clone_copy2(src, dst)
+        return dst
+    if _same_stat(src_st, dst_st):
+        return dst
+    if _same_content(src, dst, src_st, dst_st):
+        shutil.copystat(src, dst)
+        return dst
+    clone_copy2(src, dst)
+    return dst
+
+
+def _tree_fingerprint(root: Union[str, Path], names: Iterable[str]) -> Tuple[int, int]:
+    """Fingerprint selected entries of a settings directory.
+
+    Every file under the named entries contributes a hash of its relative
+    path, size and nanosecond mtime, combined with XOR so the result does
+    not depend on directory order. Because syncing copies with copy2,
+    which preserves mtimes, a source and target that were synced and not
+    modified since have equal fingerprints.
+
+    Args:
+        root: Settings directory containing the entries
+        names: Top-level entries (files or directories) to include
+
+    Returns:
+        Tuple of (combined hash, number of files). Only meaningful for
+        comparison within the same process.
+    """
+    digest = 0
+    count = 0
+    sep = os.sep
+    prefix = os.fspath(root) + sep
+    stack = [(prefix + name, name) for name in names]
+    # Bound once: this loop runs for every file under plugins/ and themes/
+    pop, extend = stack.pop, stack.extend
+    stat_path, scandir, is_dir = os.stat, os.scandir, stat.S_ISDIR
+    while stack:
+        path, rel = pop()
+        try:
+            st = stat_path(path)
+        except FileNotFoundError:
+            continue
+        if is_dir(st.st_mode):
+            with scandir(path) as entries:
+                extend((entry.path, rel + sep + entry.name) for entry in entries)
+        else:
+            digest ^= hash((rel, st.st_size, st.st_mtime_ns))
+            count += 1
+    return digest, count
+
+
 class Validatable(Protocol):
     """Protocol for objects that can be validated.
     
@@ -123,7 +306,10 @@ class SyncResult:
         The success flag will be False if any items failed to sync,
         unless ignore_errors was enabled in the configuration.
     """
-    
+
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("success", "items_synced", "items_failed", "errors")
+
     success: bool
     items_synced: List[str]
     items_failed: List[str]
@@ -222,24 +408,24 @@ class SyncManager:
     """
 
     # Core settings files that should be synced
-    CORE_SETTINGS_FILES = {
+    CORE_SETTINGS_FILES = frozenset({
         "app.json",
         "appearance.json",
         "hotkeys.json",
         "types.json",
         "templates.json",
-    }
+    })
     
     # Plugin configuration files
-    PLUGIN_FILES = {
+    PLUGIN_FILES = frozenset({
         "core-plugins.json",
         "community-plugins.json",
         "core-plugins-migration.json",
         "plugins",  # Directory containing plugin data
-    }
+    })
     
     # Directories that can be synced
-    SYNC_DIRECTORIES = {"snippets", "themes", "plugins", "icons"}
+    SYNC_DIRECTORIES = frozenset({"snippets", "themes", "plugins", "icons"})
 
     def __init__(
         self,
@@ -264,8 +450,50 @@ class SyncManager:
             self.target.vault_path,
             config.backup.backup_dir,
             config.backup.max_backups,
+            config.backup.verify_backups,
+            dedupe=config.backup.dedupe_backups,
+            exclude=config.backup.exclude,
         )
 
+        # stat results for the current sync_settings() call, keyed by path
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+
+        # Item paths are built by string concatenation on these prefixes
+        # rather than with a Path join per item
+        self._source_prefix = os.fspath(self.source.settings_dir) + os.sep
+        self._target_prefix = os.fspath(self.target.settings_dir) + os.sep
+
+    def _cached_stat(self, path: Union[str, Path]) -> Optional[os.stat_result]:
+        """stat a path once per sync_settings() call.
+
+        The existence, type and unchanged checks for an item all read the
+        same stat result instead of each issuing their own syscall. The
+        cache is cleared at the start of every sync_settings() call, and
+        entries are dropped whenever a copy rewrites their path.
+
+        Args:
+            path: Path to stat
+
+        Returns:
+            The stat result (following symlinks, like Path.exists), or
+            None if the path does not exist
+        """
+        key = os.fspath(path)
+        try:
+            return self._stat_cache[key]
+        except KeyError:
+            pass
+        try:
+            result: Optional[os.stat_result] = os.stat(key)
+        except FileNotFoundError:
+            result = None
+        self._stat_cache[key] = result
+        return result
+
+    def _forget_stat(self, path: Union[str, Path]) -> None:
+        """Drop a cached stat result after the path has been rewritten."""
+        self._stat_cache.pop(os.fspath(path), None)
+
     def _sync_plugins_directory(self) -> None:
         """Sync the plugins directory and its contents.
         
@@ -283,7 +511,7 @@ class SyncManager:
         source_plugins = self.source.settings_dir / "plugins"
         target_plugins = self.target.settings_dir / "plugins"
         
-        if not source_plugins.exists():
+        if self._cached_stat(source_plugins) is None:
             logger.debug("Source plugins directory does not exist, skipping plugin sync")
             return
 
@@ -291,19 +519,25 @@ class SyncManager:
             # Create plugins directory if it doesn't exist
             target_plugins.mkdir(exist_ok=True)
 
-            # Copy each plugin directory
-            for plugin_dir in source_plugins.iterdir():
-                if plugin_dir.is_dir():
-                    target_plugin_dir = target_plugins / plugin_dir.name
-                    logger.debug(f"Syncing plugin: {plugin_dir.name}")
-                    try:
-                        if target_plugin_dir.exists():
-                            shutil.rmtree(target_plugin_dir)
-                        shutil.copytree(plugin_dir, target_plugin_dir)
-                    except Exception as e:
-                        logger.warning(f"Failed to sync plugin {plugin_dir.name}: {e}")
-                        if not self.config.sync.ignore_errors:
-                            raise
+            # Copy each plugin directory; scandir entries carry their type,
+            # and paths are joined as strings rather than Path objects
+            target_prefix = os.fspath(target_plugins) + os.sep
+            ignore_errors = self.config.sync.ignore_errors
+            with os.scandir(source_plugins) as entries:
+                plugin_dirs = [entry for entry in entries if entry.is_dir()]
+            for plugin_dir in plugin_dirs:
+                target_plugin_dir = target_prefix + plugin_dir.name
+                logger.debug("Syncing plugin: {}", plugin_dir.name)
+                try:
+                    if os.path.exists(target_plugin_dir):
+                        shutil.rmtree(target_plugin_dir)
+                    parallel_copytree(
+                        plugin_dir.path, target_plugin_dir, copy_function=clone_copy2
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to sync plugin {plugin_dir.name}: {e}")
+                    if not ignore_errors:
+                        raise
 
     def _sync_icons_directory(self) -> None:
         """Sync the icons directory and its contents.
@@ -321,15 +555,16 @@ class SyncManager:
         source_icons = self.source.settings_dir / "icons"
         target_icons = self.target.settings_dir / "icons"
         
-        if not source_icons.exists():
+        if self._cached_stat(source_icons) is None:
             logger.debug("Source icons directory does not exist, skipping icons sync")
             return
 
         if not self.config.sync.dry_run:
             try:
-                if target_icons.exists():
+                if self._cached_stat(target_icons) is not None:
                     shutil.rmtree(target_icons)
-                shutil.copytree(source_icons, target_icons)
+                parallel_copytree(source_icons, target_icons, copy_function=clone_copy2)
+                self._forget_stat(target_icons)
                 logger.debug("Successfully synced icons directory")
             except Exception as e:
                 logger.warning(f"Failed to sync icons directory: {e}")
@@ -362,45 +597,44 @@ class SyncManager:
             ...     "plugins"
             ... ])
         """
+        sync_cfg = self.config.sync
+
+        if items is not None and not items:
+            return set()
+
+        # One directory read instead of an exists() call per candidate
+        try:
+            with os.scandir(self.source.settings_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+
+        # Narrow to the requested items once, up front; every check below
+        # is then a hashed lookup in (or intersection with) the small set
+        if items is not None:
+            present.intersection_update(items)
+
         sync_items: Set[str] = set()
 
         # Add core settings if enabled
-        if self.config.sync.core_settings:
-            sync_items.update(
-                item for item in self.CORE_SETTINGS_FILES
-                if (self.source.settings_dir / item).exists()
-            )
+        if sync_cfg.core_settings:
+            sync_items |= self.CORE_SETTINGS_FILES & present
 
         # Add plugin settings and directory if enabled
-        if self.config.sync.core_plugins or self.config.sync.community_plugins:
-            # Add plugin configuration files
-            sync_items.update(
-                item for item in self.PLUGIN_FILES
-                if (self.source.settings_dir / item).exists()
-            )
-            
-            # Add plugins directory if it exists
-            if (self.source.settings_dir / "plugins").exists():
-                sync_items.add("plugins")
+        if sync_cfg.core_plugins or sync_cfg.community_plugins:
+            # Add plugin configuration files (including the plugins directory)
+            sync_items |= self.PLUGIN_FILES & present
 
             # Add icons directory if it exists
-            if (self.source.settings_dir / "icons").exists():
+            if "icons" in present:
                 sync_items.add("icons")
 
         # Add directories if enabled
-        if self.config.sync.snippets:
-            if (self.source.settings_dir / "snippets").exists():
-                sync_items.add("snippets")
-
-        if self.config.sync.themes:
-            if (self.source.settings_dir / "themes").exists():
-                sync_items.add("themes")
+        if sync_cfg.snippets and "snippets" in present:
+            sync_items.add("snippets")
 
-        # Filter by provided items if specified
-        if items is not None:
-            if not items:
-                return set()
-            sync_items = {item for item in items if item in sync_items}
+        if sync_cfg.themes and "themes" in present:
+            sync_items.add("themes")
 
         return sync_items
 
@@ -410,6 +644,8 @@ class SyncManager:
         This method handles the actual synchronization of a single item,
         which can be either a file or directory. It includes:
         - Special handling for plugins and icons directories
+        - Skipping files whose size and mtime, or failing that whose
+          content hash, already match the target
         - JSON validation for .json files
         - File and directory copying
         
@@ -420,10 +656,13 @@ class SyncManager:
             SyncError: If the source item doesn't exist or sync fails
             ValidationError: If JSON validation fails
         """
-        source_path = self.source.settings_dir / item
-        target_path = self.target.settings_dir / item
+        source_path = self._source_prefix + item
+        target_path = self._target_prefix + item
+        sync_cfg = self.config.sync
+        dry_run = sync_cfg.dry_run
 
-        if not source_path.exists():
+        source_stat = self._cached_stat(source_path)
+        if source_stat is None:
             raise SyncError(
                 f"Source item does not exist: {item}",
                 source=self.source.vault_path,
@@ -434,7 +673,7 @@ class SyncManager:
             try:
                 # Special handling for plugins directory
                 if item == "plugins":
-                    if not self.config.sync.dry_run:
+                    if not dry_run:
                         self._sync_plugins_directory()
                     else:
                         logger.info("Would sync plugins directory (dry run)")
@@ -442,34 +681,57 @@ class SyncManager:
 
                 # Special handling for icons directory
                 if item == "icons":
-                    if not self.config.sync.dry_run:
+                    if not dry_run:
                         self._sync_icons_directory()
                     else:
                         logger.info("Would sync icons directory (dry run)")
                     return
 
+                # Files a previous sync already copied need neither
+                # validation nor copying
+                target_stat = self._cached_stat(target_path)
+                if _same_stat(source_stat, target_stat):
+                    logger.debug("Unchanged since last sync, skipping: {}", item)
+                    return
+
+                # Same bytes under a different mtime: only the timestamps
+                # need copying, which lets the next sync skip on stat alone
+                if _same_content(source_path, target_path, source_stat, target_stat):
+                    logger.debug("Content unchanged, skipping: {}", item)
+                    if not dry_run:
+                        shutil.copystat(source_path, target_path)
+                        self._forget_stat(target_path)
+                    return
+
                 # Validate JSON files
                 if item.endswith('.json'):
                     try:
-                        self.validate_json_file(source_path)
+                        self.validate_json_file(Path(source_path))
                     except ValidationError as e:
                         logger.warning(f"Invalid JSON: {item} - {str(e)}")
-                        if not self.config.sync.ignore_errors:
+                        if not sync_cfg.ignore_errors:
                             raise
 
                 # Copy file or directory
-                if not self.config.sync.dry_run:
+                if not dry_run:
                     try:
-                        if source_path.is_file():
-                            shutil.copy2(source_path, target_path)
+                        # Clones share data extents with the source on
+                        # copy-on-write filesystems (btrfs, XFS, APFS)
+                        if stat.S_ISREG(source_stat.st_mode):
+                            clone_copy2(source_path, target_path)
                         else:
-                            shutil.copytree(source_path, target_path, dirs_exist_ok=True)
+                            parallel_copytree(
+                                source_path,
+                                target_path,
+                                copy_function=_copy_if_changed,
+                            )
+                        self._forget_stat(target_path)
                     except Exception as e:
                         logger.warning(f"Failed to copy {item}: {e}")
-                        if not self.config.sync.ignore_errors:
+                        if not sync_cfg.ignore_errors:
                             raise
             except Exception as e:
-                if not self.config.sync.ignore_errors:
+                if not sync_cfg.ignore_errors:
                     raise
                 logger.warning(f"Failed to sync {item}: {str(e)}")
                 raise
@@ -479,10 +741,11 @@ class SyncManager:
         
         This is the main method for performing vault synchronization. It:
         1. Validates both vaults
-        2. Creates a backup of the target vault
-        3. Determines which items to sync
-        4. Syncs each item individually
-        5. Handles errors according to configuration
+        2. Determines which items to sync
+        3. Returns early if the target already matches the source
+        4. Creates a backup of the target vault
+        5. Syncs the items concurrently (serially in dry run mode)
+        6. Handles errors according to configuration
         
         Args:
             items: Optional list of specific items to sync. If not provided,
@@ -509,38 +772,68 @@ class SyncManager:
             >>> if result.success:
             ...     print("Synced items:", result.items_synced)
         """
+        self._stat_cache.clear()
         try:
             # Validate vaults
             self._validate_vaults()
             
-            # Create backup if not in dry run mode
-            if not self.config.sync.dry_run:
-                self._create_backup()
-            
             # Get items to sync
             sync_items = self._get_sync_items(items)
             if not sync_items:
                 logger.warning("No items to sync")
                 return SyncResult(True, [], [], {})
+
+            # Nothing to back up or copy if the target already matches
+            if self._is_in_sync(sync_items):
+                logger.info("Target vault is already in sync")
+                return SyncResult(True, sorted(sync_items), [], {})
+            
+            # Create backup if not in dry run mode
+            sync_cfg = self.config.sync
+            ignore_errors = sync_cfg.ignore_errors
+            if not sync_cfg.dry_run:
+                self._create_backup()
             
             # Track results
             synced_items: List[str] = []
             failed_items: List[str] = []
             errors: Dict[str, str] = {}
             
-            # Sync each item
-            for item in sync_items:
+            # Sync each item; items touch disjoint paths, so real runs copy
+            # them concurrently while dry runs keep their log output in order
+            ordered = sorted(sync_items)
+            workers = 1 if sync_cfg.dry_run else min(MAX_SYNC_WORKERS, len(ordered))
+            stop = threading.Event()
+
+            def run(item: str) -> bool:
+                # The first failure aborts the sync, so items still queued
+                # behind it are skipped instead of started
+                if stop.is_set():
+                    return False
                 try:
                     self._sync_item(item)
-                    synced_items.append(item)
-                except Exception as e:
-                    failed_items.append(item)
-                    errors[item] = str(e)
-                    if not self.config.sync.ignore_errors:
-                        raise
+                except Exception:
+                    if not ignore_errors:
+                        stop.set()
+                    raise
+                return True
+
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="obsyncit-sync"
+            ) as executor:
+                futures = [executor.submit(run, item) for item in ordered]
+                for item, future in zip(ordered, futures):
+                    try:
+                        if future.result():
+                            synced_items.append(item)
+                    except Exception as e:
+                        failed_items.append(item)
+                        errors[item] = str(e)
+                        if not ignore_errors:
+                            raise
             
             # Return results
-            success = len(failed_items) == 0 or self.config.sync.ignore_errors
+            success = len(failed_items) == 0 or ignore_errors
             return SyncResult(
                 success=success,
                 items_synced=synced_items,
@@ -557,6 +850,25 @@ class SyncManager:
                 errors={"sync": str(e)},
             )
 
+    def _is_in_sync(self, sync_items: Set[str]) -> bool:
+        """Check whether the target already matches the source.
+
+        Compares fingerprints (relative path, size and mtime of every
+        file) of the selected items in both vaults. A single walk of each
+        tree is far cheaper than a backup plus a full sync.
+
+        Args:
+            sync_items: Items that would be synced
+
+        Returns:
+            True if every selected file is present in the target with the
+            same size and mtime, and the target has no extra files under
+            the selected items
+        """
+        return _tree_fingerprint(
+            self.source.settings_dir, sync_items
+        ) == _tree_fingerprint(self.target.settings_dir, sync_items)
+
     def _validate_vaults(self) -> None:
         """Validate source and target vaults.
         
@@ -636,8 +948,20 @@ class SyncManager:
             ... )
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if orjson is not None and size >= MMAP_THRESHOLD:
+                    # orjson parses the mapped pages in place, so large
+                    # plugin data files are never copied into a bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # The parser reads front to back, so ask for
+                        # aggressive readahead where the platform allows
+                        if _MADV_SEQUENTIAL is not None:
+                            mm.madvise(_MADV_SEQUENTIAL)
+                        with memoryview(mm) as view:
+                            data = _loads_json(view)
+                else:
+                    data = _loads_json(f.read())
             
             if required_fields:
                 missing = [f for f in required_fields if f not in data]
@@ -689,9 +1013,9 @@ class SyncManager:
             ...     shutil.copy2(source_path, target_path)
         """
         try:
-            logger.debug(f"Starting sync of {item}")
+            logger.debug("Starting sync of {}", item)
             yield
-            logger.debug(f"Successfully synced {item}")
+            logger.debug("Successfully synced {}", item)
         except Exception as e:
             logger.error(f"Failed to sync {item}: {e}")
             raise SyncError(
@@ -701,11 +1025,12 @@ class SyncManager:
                 details=str(e)
             )
 
-    def list_backups(self) -> List[str]:
+    def list_backups(self) -> Sequence[BackupInfo]:
         """List available backups for the target vault.
         
         Returns:
-            List of backup names, sorted by creation time (newest first)
+            BackupInfo for each backup, sorted by creation time (newest
+            first); each carries its directory as a Path
         """
         return self.backup_mgr.list_backups()
 
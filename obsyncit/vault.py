@@ -49,11 +49,17 @@ Example Usage:
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Optional, Set, Union, List
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 from obsyncit.errors import (
     VaultError,
     handle_file_operation_error,
@@ -197,8 +203,12 @@ class VaultManager:
                     self.settings_dir
                 )
 
-            # Check if there are any settings files
-            if not any(self.settings_dir.glob("*.json")):
+            # Check if there are any settings files; stop at the first one
+            with os.scandir(self.settings_dir) as entries:
+                has_settings = any(
+                    entry.name.endswith(".json") for entry in entries
+                )
+            if not has_settings:
                 raise VaultError(
                     "No settings files found",
                     self.settings_dir
@@ -242,12 +252,23 @@ class VaultManager:
             ...     print("File not found")
         """
         try:
-            if not file_path.exists():
+            # One read of the raw bytes; the parsers validate UTF-8
+            # themselves, so no text decoding layer is needed
+            try:
+                raw = file_path.read_bytes()
+            except FileNotFoundError:
                 logger.warning(f"File does not exist: {file_path}")
                 return False
 
-            with open(file_path, encoding='utf-8') as f:
-                json.load(f)
+            if orjson is not None:
+                try:
+                    orjson.loads(raw)
+                    return True
+                except orjson.JSONDecodeError:
+                    # orjson rejects NaN/Infinity and very large integers,
+                    # which the json module (and Obsidian) accept
+                    pass
+            json.loads(raw)
             return True
 
         except json.JSONDecodeError as e:
@@ -288,13 +309,16 @@ class VaultManager:
             >>> print(f"Total settings: {len(files)}")
         """
         try:
-            if not self.settings_dir.exists():
-                return set()
-
-            return {
-                f.name for f in self.settings_dir.glob("*.json")
-                if f.is_file()
-            }
+            # scandir reports file types from the directory entries, so
+            # only symlinks cost an extra stat
+            with os.scandir(self.settings_dir) as entries:
+                return {
+                    entry.name for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                }
+
+        except FileNotFoundError:
+            return set()
 
         except Exception as e:
             handle_file_operation_error(e, "listing settings files", self.settings_dir)
@@ -333,13 +357,14 @@ class VaultManager:
             ...     print(f"Found {theme_count} themes")
         """
         try:
-            if not self.settings_dir.exists():
-                return set()
+            with os.scandir(self.settings_dir) as entries:
+                return {
+                    entry.name for entry in entries
+                    if not entry.name.startswith(".") and entry.is_dir()
+                }
 
-            return {
-                d.name for d in self.settings_dir.iterdir()
-                if d.is_dir() and not d.name.startswith(".")
-            }
+        except FileNotFoundError:
+            return set()
 
         except Exception as e:
             handle_file_operation_error(e, "listing settings directories", self.settings_dir)
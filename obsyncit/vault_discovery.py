@@ -59,6 +59,7 @@ Performance Notes:
     - File operations use Path objects for efficiency
 """
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Iterator
@@ -192,7 +193,7 @@ class VaultDiscovery:
             - Skips hidden directories (starting with .) for better performance
             - Silently skips directories that can't be accessed
             - Stops traversal at max_depth
-            - Uses Path.iterdir() for efficient directory listing
+            - Uses os.scandir(), whose entries know their own file type
 
         Example:
             >>> discoverer = VaultDiscovery(max_depth=2)
@@ -204,10 +205,15 @@ class VaultDiscovery:
             return
 
         try:
-            for path in root.iterdir():
-                if path.is_dir() and not path.name.startswith('.'):
-                    yield (path, current_depth)
-                    yield from self._iter_directories(path, current_depth + 1)
+            with os.scandir(root) as it:
+                entries = [
+                    entry.path for entry in it
+                    if not entry.name.startswith('.') and entry.is_dir()
+                ]
+            for entry_path in entries:
+                path = Path(entry_path)
+                yield (path, current_depth)
+                yield from self._iter_directories(path, current_depth + 1)
         except Exception:
             # Skip directories we can't access
             return
@@ -234,7 +240,7 @@ class VaultDiscovery:
             - Handles filesystem errors gracefully
             - Only checks structure, not content validity
             - Returns False for any error condition
-            - Uses Path.glob() for efficient file matching
+            - Stops scanning .obsidian at the first JSON file
 
         Example:
             >>> discoverer = VaultDiscovery()
@@ -245,13 +251,10 @@ class VaultDiscovery:
             ...     print(f"Not a valid vault: {path}")
         """
         try:
-            obsidian_dir = path / ".obsidian"
-            if not obsidian_dir.exists():
-                return False
-            
-            # Check for at least one settings file
-            settings_files = list(obsidian_dir.glob("*.json"))
-            return len(settings_files) > 0
+            # Check for at least one settings file; a missing .obsidian
+            # directory raises, so no separate exists() check is needed
+            with os.scandir(os.path.join(path, ".obsidian")) as entries:
+                return any(entry.name.endswith(".json") for entry in entries)
         except Exception:
             return False
 
@@ -335,7 +338,7 @@ class VaultDiscovery:
             - Returns basic info even if vault can't be fully accessed
             - Uses VaultManager for consistent vault handling
             - Handles filesystem errors gracefully
-            - Efficient file counting using Path.glob()
+            - Counts entries with one os.scandir() per directory
 
         Example:
             >>> discoverer = VaultDiscovery()
@@ -350,9 +353,15 @@ class VaultDiscovery:
         """
         try:
             vault = VaultManager(vault_path)
-            settings_files = len(list(vault.settings_dir.glob("*.json")))
-            plugins_dir = vault.settings_dir / "plugins"
-            plugin_count = len(list(plugins_dir.glob("*"))) if plugins_dir.exists() else 0
+            with os.scandir(vault.settings_dir) as entries:
+                settings_files = sum(
+                    1 for entry in entries if entry.name.endswith(".json")
+                )
+            try:
+                with os.scandir(vault.settings_dir / "plugins") as entries:
+                    plugin_count = sum(1 for _ in entries)
+            except FileNotFoundError:
+                plugin_count = 0
 
             return VaultInfo(
                 name=vault_path.name,
@@ -11,12 +11,15 @@ setup(
     install_requires=[
         "rich>=13.7.0",
         "loguru>=0.7.2",
-        "tomli>=2.0.1",
+        "tomli>=2.0.1; python_version < '3.11'",
         "pydantic>=2.6.1",
         "jsonschema>=4.21.1",
         "setuptools>=69.0.3",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=8.0.0",
             "pytest-cov>=4.1.0",
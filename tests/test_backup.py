@@ -1,10 +1,15 @@
 """Tests for backup functionality."""
 
+import errno
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
 import pytest
 import shutil
+from obsyncit import backup as backup_module, fileops
 from obsyncit.backup import BackupManager, BackupInfo
 from obsyncit.errors import BackupError
 
@@ -96,4 +101,549 @@ def test_list_backups_sorted(backup_manager):
         assert len(backups) == 3
         
         timestamps = [b.timestamp.timestamp() for b in backups]
-        assert timestamps == sorted(timestamps, reverse=True)
\ No newline at end of file
+        assert timestamps == sorted(timestamps, reverse=True)
+
+
+@pytest.fixture
+def vault_settings(tmp_path):
+    """Create tmp_path/vault with a .obsidian holding app.json and plugins."""
+    settings = tmp_path / "vault" / ".obsidian"
+    (settings / "plugins").mkdir(parents=True)
+    (settings / "app.json").write_text("{}")
+    return settings
+
+
+def test_verify_backup_reports_missing_entries(tmp_path, vault_settings):
+    """Test that verification flags settings missing from the backup."""
+    (vault_settings / "hotkeys.json").write_text("{}")
+
+    manager = BackupManager(vault_path=vault_settings.parent, backup_dir=tmp_path / "backups")
+    backup_settings = tmp_path / "copy"
+    backup_settings.mkdir()
+    (backup_settings / "app.json").write_text("{}")
+
+    with pytest.raises(BackupError) as exc_info:
+        manager._verify_backup(backup_settings)
+    assert "hotkeys.json" in str(exc_info.value.details)
+
+    (backup_settings / "hotkeys.json").write_text("{}")
+    with pytest.raises(BackupError, match="resource directories"):
+        manager._verify_backup(backup_settings)
+
+    (backup_settings / "plugins").mkdir()
+    manager._verify_backup(backup_settings)
+
+
+def test_verify_backup_checks_copied_inventory(tmp_path, vault_settings):
+    """Test verification against the inventory reported by the copy."""
+    manager = BackupManager(vault_path=vault_settings.parent, backup_dir=tmp_path / "backups")
+
+    backup_settings = tmp_path / "copy"
+    (backup_settings / "plugins" / "dataview").mkdir(parents=True)
+    expected = ["plugins", os.path.join("plugins", "dataview"),
+                os.path.join("plugins", "dataview", "main.js")]
+
+    with pytest.raises(BackupError, match="Missing files") as exc_info:
+        manager._verify_backup(backup_settings, expected)
+    assert "main.js" in str(exc_info.value.details)
+
+    (backup_settings / "plugins" / "dataview" / "main.js").write_text("")
+    manager._verify_backup(backup_settings, expected)
+
+    with pytest.raises(BackupError, match="Missing core settings"):
+        manager._verify_backup(backup_settings, expected + ["app.json"])
+
+
+@pytest.fixture
+def make_backups(tmp_path):
+    """Return a helper that creates empty backups under tmp_path/backups."""
+    backups_dir = tmp_path / "backups"
+
+    def make(*names):
+        for name in names:
+            (backups_dir / name / ".obsidian").mkdir(parents=True)
+        return backups_dir
+
+    return make
+
+
+def test_list_backups_scans_once_while_unchanged(tmp_path, make_backups):
+    """Test that listings are cached until a backup is added or removed."""
+    backups_dir = make_backups("backup_100", "backup_300")
+    manager = BackupManager(vault_path=tmp_path / "vault", backup_dir=backups_dir)
+    (backups_dir / "backup_200").write_text("not a directory")
+    (backups_dir / "other").mkdir()
+    # Age the directory past the settle window so listings are cached
+    os.utime(backups_dir, ns=(10**18, 10**18))
+
+    assert [b.path.name for b in manager.list_backups()] == ["backup_300", "backup_100"]
+
+    with patch("obsyncit.backup.os.scandir", side_effect=AssertionError):
+        assert len(manager.list_backups()) == 2
+
+    # Any change to the directory, even from another process, is seen
+    make_backups("backup_400")
+    assert [b.path.name for b in manager.list_backups()][0] == "backup_400"
+
+    manager._invalidate_backup_cache()
+    assert len(manager.list_backups()) == 3
+
+
+def test_list_backups_does_not_cache_unsettled_listing(tmp_path, make_backups):
+    """Test that a listing taken right after a change is not reused."""
+    backups_dir = make_backups("backup_100")
+    manager = BackupManager(vault_path=tmp_path / "vault", backup_dir=backups_dir)
+
+    assert len(manager.list_backups()) == 1
+    assert manager._backup_cache is None
+
+
+def test_concurrent_list_backups_share_one_scan(tmp_path, make_backups):
+    """Test that threads listing at the same time scan the directory once."""
+    backups_dir = make_backups("backup_100")
+    os.utime(backups_dir, ns=(10**18, 10**18))
+    manager = BackupManager(vault_path=tmp_path / "vault", backup_dir=backups_dir)
+
+    started = threading.Event()
+    real_from_backup_path = BackupInfo.from_backup_path
+    calls = []
+
+    def slow_from_backup_path(path):
+        calls.append(path)
+        started.set()
+        threading.Event().wait(0.05)
+        return real_from_backup_path(path)
+
+    with patch.object(BackupInfo, "from_backup_path", side_effect=slow_from_backup_path):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(manager.list_backups)
+            started.wait()
+            others = [pool.submit(manager.list_backups) for _ in range(3)]
+            results = [first.result()] + [f.result() for f in others]
+
+    assert len(calls) == 1
+    assert all(len(r) == 1 for r in results)
+
+
+def test_cleanup_retires_old_backups_in_background(tmp_path, make_backups):
+    """Test that expired backups are hidden at once and deleted later."""
+    backups_dir = make_backups(
+        "backup_100", "backup_200", "backup_300", "backup_50.todelete"
+    )
+
+    manager = BackupManager(
+        vault_path=tmp_path / "vault", backup_dir=backups_dir, max_backups=2
+    )
+    manager._cleanup_old_backups()
+
+    assert [b.path.name for b in manager.list_backups()] == ["backup_300", "backup_200"]
+
+    manager._gc_executor.shutdown(wait=True)
+    assert sorted(p.name for p in backups_dir.iterdir()) == ["backup_200", "backup_300"]
+
+
+def test_cleanup_orders_backups_by_name_without_backup_info(tmp_path, make_backups):
+    """Test that cleanup picks the oldest backups from their names alone."""
+    backups_dir = make_backups("backup_900", "backup_1000", "backup_80")
+    # Not a backup: no settings directory inside
+    (backups_dir / "backup_1").mkdir()
+
+    manager = BackupManager(
+        vault_path=tmp_path / "vault", backup_dir=backups_dir, max_backups=1
+    )
+    with patch.object(BackupInfo, "from_backup_path", side_effect=AssertionError):
+        manager._cleanup_old_backups()
+    manager._gc_executor.shutdown(wait=True)
+
+    assert sorted(p.name for p in backups_dir.iterdir()) == ["backup_1", "backup_1000"]
+
+
+def test_latest_backup_found_without_backup_info(tmp_path, make_backups):
+    """Test that restore picks the newest backup from the names alone."""
+    backups_dir = make_backups("backup_900", "backup_1000_000000001", "backup_1000")
+    (backups_dir / "backup_2000").mkdir()
+
+    manager = BackupManager(vault_path=tmp_path / "vault", backup_dir=backups_dir)
+    with patch.object(BackupInfo, "from_backup_path", side_effect=AssertionError):
+        latest = manager._get_backup_path()
+    assert latest == backups_dir / "backup_1000_000000001"
+
+
+def test_delete_trees_removes_each_tree_despite_failures(tmp_path, make_backups):
+    """Test that expired backups are deleted together and failures isolated."""
+    backups_dir = make_backups("a", "b", "c")
+    trees = [backups_dir / name for name in ("a", "b", "c")]
+    real_rmtree = fileops.fast_rmtree
+
+    def rmtree(path):
+        if Path(path).name == "b":
+            raise PermissionError(13, "denied", str(path))
+        real_rmtree(path)
+
+    manager = BackupManager(tmp_path / "vault", backup_dir=backups_dir)
+    with patch("obsyncit.backup.fast_rmtree", side_effect=rmtree) as mock_rmtree:
+        manager._delete_trees(trees)
+
+    assert mock_rmtree.call_count == 3
+    assert [p.name for p in backups_dir.iterdir()] == ["b"]
+
+    # A refused path is logged too and doesn't stop the rest or the prune
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    with patch.object(manager, "_prune_objects") as prune:
+        manager._delete_trees([outside, backups_dir / "b"], prune=True)
+        manager._delete_trees([outside], prune=True)
+    assert prune.call_count == 2
+    assert outside.is_dir()
+    assert not (backups_dir / "b").exists()
+
+
+def test_remove_tree_only_deletes_backup_paths(tmp_path):
+    """Test that fast deletion is limited to paths the manager owns."""
+    vault = tmp_path / "vault"
+    manager = BackupManager(vault, backup_dir=tmp_path / "backups")
+    for path in (vault / ".obsidian.old" / "plugins", tmp_path / "backups" / "x"):
+        path.mkdir(parents=True)
+
+    manager._remove_tree(vault / ".obsidian.old")
+    manager._remove_tree(tmp_path / "backups" / "x")
+    assert not (vault / ".obsidian.old").exists()
+    assert not (tmp_path / "backups" / "x").exists()
+
+    for path in (vault, tmp_path / "backups", vault / "notes", tmp_path / "backups" / ".." / "vault"):
+        with pytest.raises(ValueError, match="Refusing"):
+            manager._remove_tree(path)
+    assert vault.is_dir()
+
+
+def test_paths_to_verify_samples_nested_paths(tmp_path):
+    """Test that only top-level entries and a sample are verified by default."""
+    copied = ["app.json", "plugins"] + [
+        os.path.join("plugins", f"p{i}") for i in range(100)
+    ]
+
+    sampled = BackupManager(tmp_path / "vault")._paths_to_verify(copied)
+    assert sampled[:2] == ["app.json", "plugins"]
+    assert len(sampled) == 2 + BackupManager.VERIFY_SAMPLE_SIZE
+    assert set(sampled) <= set(copied)
+
+    full = BackupManager(tmp_path / "vault", verify_backups=True)
+    assert full._paths_to_verify(copied) == copied
+
+
+@pytest.fixture
+def restorable_vault(tmp_path, vault_settings):
+    """Create a vault with current settings and one older backup."""
+    (vault_settings / "app.json").write_text('{"current": true}')
+
+    backup = tmp_path / "backups" / "backup_100" / ".obsidian"
+    (backup / "themes").mkdir(parents=True)
+    (backup / "app.json").write_text('{"current": false}')
+
+    manager = BackupManager(vault_path=vault_settings.parent, backup_dir=tmp_path / "backups")
+    return manager, backup.parent
+
+
+def test_restore_backup_swaps_in_staged_copy(restorable_vault):
+    """Test that restore replaces the settings and cleans up after itself."""
+    manager, backup = restorable_vault
+    manager.restore_backup(backup)
+    manager._gc_executor.shutdown(wait=True)
+
+    settings = manager.settings_dir
+    assert (settings / "app.json").read_text() == '{"current": false}'
+    assert (settings / "themes").is_dir()
+    assert not (settings / "plugins").exists()
+    assert sorted(p.name for p in settings.parent.iterdir()) == [".obsidian"]
+
+
+def test_restore_backup_keeps_previous_settings_as_backup(restorable_vault):
+    """Test that the pre-restore backup is the renamed settings, not a copy."""
+    manager, backup = restorable_vault
+    manager._cross_device = False
+    inode = (manager.settings_dir / "app.json").stat().st_ino
+
+    with patch.object(manager, "create_backup") as create_backup:
+        manager.restore_backup(backup)
+    create_backup.assert_not_called()
+
+    latest = manager.list_backups()[0].path / ".obsidian"
+    assert latest.parent != backup
+    assert (latest / "app.json").read_text() == '{"current": true}'
+    assert (latest / "app.json").stat().st_ino == inode
+    assert (latest / "plugins").is_dir()
+
+
+def test_restore_backup_copies_snapshot_when_rename_crosses_devices(
+    restorable_vault, monkeypatch
+):
+    """Test that an EXDEV rename into a backup falls back to a copied backup."""
+    manager, backup = restorable_vault
+    manager._cross_device = False
+    rename = os.rename
+
+    def refuse_backup_dir(src, dst):
+        if Path(src) == manager.settings_dir and manager.backup_dir in Path(dst).parents:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        rename(src, dst)
+
+    monkeypatch.setattr(backup_module.os, "rename", refuse_backup_dir)
+    manager.restore_backup(backup)
+    manager._gc_executor.shutdown(wait=True)
+
+    assert (manager.settings_dir / "app.json").read_text() == '{"current": false}'
+    assert manager._cross_device
+    backups = manager.list_backups()
+    assert len(backups) == 2
+    latest = backups[0].path / ".obsidian"
+    assert (latest / "app.json").read_text() == '{"current": true}'
+    assert not manager.settings_dir.with_name(
+        manager.settings_dir.name + manager.RESTORE_OLD_SUFFIX
+    ).exists()
+
+
+def test_restore_snapshot_matches_a_created_backup(restorable_vault):
+    """Test that the renamed snapshot drops excluded entries and is verified."""
+    manager, backup = restorable_vault
+    manager._cross_device = False
+    manager.verify_backups = True
+    settings = manager.settings_dir
+    (settings / "plugins" / "dataview").mkdir()
+    (settings / "workspace-mobile.json").write_text('{"panes": 1}')
+    (settings / ".trash" / "old").mkdir(parents=True)
+
+    with patch.object(manager, "_verify_backup", wraps=manager._verify_backup) as verify:
+        manager.restore_backup(backup)
+
+    latest = manager.list_backups()[0].path / ".obsidian"
+    assert sorted(p.name for p in latest.iterdir()) == ["app.json", "plugins"]
+    snapshot_dir, inventory = verify.call_args.args
+    assert snapshot_dir == latest
+    assert sorted(inventory) == sorted(
+        ["app.json", "plugins", os.path.join("plugins", "dataview")]
+    )
+    assert (settings / "workspace-mobile.json").read_text() == '{"panes": 1}'
+    assert (settings / ".trash" / "old").is_dir()
+
+
+def test_restore_backup_failure_keeps_current_settings(restorable_vault):
+    """Test that a failed copy leaves the live settings untouched."""
+    manager, backup = restorable_vault
+    with patch("obsyncit.backup.parallel_copytree", side_effect=OSError("disk full")):
+        with pytest.raises(BackupError, match="Failed to restore backup"):
+            manager.restore_backup(backup)
+
+    settings = manager.settings_dir
+    assert (settings / "app.json").read_text() == '{"current": true}'
+    assert sorted(p.name for p in settings.parent.iterdir()) == [".obsidian"]
+
+
+def test_create_backup_failure_removes_partial_backup(restorable_vault):
+    """Test that a failed copy is reported and leaves no backup behind."""
+    manager, old_backup = restorable_vault
+    with patch("obsyncit.backup.parallel_copytree", side_effect=OSError("disk full")):
+        manager._cross_device = False
+        with pytest.raises(BackupError, match="Failed to copy settings") as exc_info:
+            manager.create_backup()
+
+    assert exc_info.value.details == ["disk full"]
+    assert [p.name for p in manager.backup_dir.iterdir()] == [old_backup.name]
+
+
+def test_backup_info_from_single_scan(tmp_path):
+    """Test BackupInfo contents and errors for missing backups."""
+    backup = tmp_path / "backup_1700000000"
+    settings = backup / ".obsidian"
+    (settings / "plugins").mkdir(parents=True)
+    (settings / "app.json").write_text("{}")
+    (settings / "hotkeys.json").write_text("{}")
+    (settings / "plugins" / "main.js").write_bytes(b"x" * 1024 * 1024)
+    (settings / "icons").write_text("")
+
+    with patch.object(backup_module, "_tree_size", wraps=backup_module._tree_size) as walk:
+        info = BackupInfo.from_backup_path(backup)
+        assert info.timestamp == 1700000000
+        assert info.settings_count == 2
+        assert info.size_mb is None
+        assert info == BackupInfo.from_backup_path(backup) and "size_mb" not in repr(info)
+        walk.assert_not_called()
+        assert info.size() == pytest.approx(1 + 4 / (1024 * 1024))
+        assert info.size() == info.size_mb
+        walk.assert_called_once()
+        assert not (backup / BackupInfo.INFO_FILE).exists()
+
+        # Only a recording read writes the sidecar, which a fresh listing
+        # then reads back
+        assert BackupInfo.from_backup_path(backup).size(record=True) == info.size_mb
+        assert (backup / BackupInfo.INFO_FILE).is_file()
+        again = BackupInfo.from_backup_path(backup)
+        assert again.size() == info.size_mb
+        assert walk.call_count == 2
+
+        # Changing the settings invalidates it
+        (settings / "themes").mkdir()
+        (settings / "themes" / "dark.css").write_bytes(b"x" * 1024 * 1024)
+        assert BackupInfo.from_backup_path(backup).size() == pytest.approx(
+            2 + 4 / (1024 * 1024)
+        )
+        assert walk.call_count == 3
+
+        # A size passed in is used as-is
+        given = BackupInfo(path=backup, timestamp=1.0, settings_count=0, size_mb=2.5)
+        assert given.size() == 2.5
+        assert walk.call_count == 3
+    assert info.has_plugins and not info.has_themes and not info.has_icons
+
+    with pytest.raises(ValueError, match="Backup not found"):
+        BackupInfo.from_backup_path(tmp_path / "missing")
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(ValueError, match="No settings found"):
+        BackupInfo.from_backup_path(tmp_path / "empty")
+
+
+def test_create_and_restore_do_not_measure_backups(restorable_vault):
+    """Test that only size(record=True) walks a backup and writes its sidecar."""
+    manager, old_backup = restorable_vault
+    with patch.object(backup_module, "_tree_size", wraps=backup_module._tree_size) as walk:
+        created = manager.create_backup()
+        manager.restore_backup(old_backup)
+        walk.assert_not_called()
+        assert not (created.path / BackupInfo.INFO_FILE).exists()
+
+        created.size(record=True)
+        walk.assert_called_once()
+    assert (created.path / BackupInfo.INFO_FILE).is_file()
+
+
+def test_backups_in_the_same_second_get_distinct_names(restorable_vault, monkeypatch):
+    """Test that back-to-back backups never share a directory."""
+    manager, old_backup = restorable_vault
+    monkeypatch.setattr("obsyncit.backup.time.time_ns", lambda: 1_700_000_000_000_000_000)
+
+    first = manager.create_backup()
+    second = manager.create_backup()
+
+    assert first.path != second.path
+    assert first.path.name == "backup_1700000000_000000000"
+    assert [b.path for b in manager.list_backups()][:2] == [second.path, first.path]
+    assert manager.list_backups()[-1].path == old_backup
+
+
+def test_max_workers_is_passed_to_the_copy(restorable_vault, tmp_path):
+    """Test that the configured pool size reaches the tree copy."""
+    manager, _ = restorable_vault
+    manager.max_workers = 3
+    manager._cross_device = False
+
+    with patch("obsyncit.backup.parallel_copytree", return_value=[]) as copytree:
+        manager._copy_tree(manager.settings_dir, tmp_path / "copy")
+    assert copytree.call_args.kwargs["max_workers"] == 3
+
+    with patch("obsyncit.backup.sys.platform", "win32"), \
+            patch("obsyncit.backup.pipe_copytree", return_value=[]) as pipe:
+        manager._copy_tree(manager.settings_dir, tmp_path / "copy")
+    assert pipe.call_args.kwargs["max_workers"] == 3
+
+    with pytest.raises(ValueError, match="max_workers"):
+        BackupManager(tmp_path / "vault", max_workers=0)
+
+
+def test_dedupe_links_unchanged_files_and_prunes_objects(tmp_path, vault_settings):
+    """Test that deduplicated backups share unchanged files and clean up."""
+    settings = vault_settings
+    (settings / "plugins" / "dataview").mkdir()
+    (settings / "plugins" / "dataview" / "main.js").write_text("console.log(1)")
+
+    manager = BackupManager(
+        vault_path=settings.parent, backup_dir=tmp_path / "backups", max_backups=2, dedupe=True
+    )
+    first = manager.create_backup().path / ".obsidian"
+    (settings / "app.json").write_text('{"theme": "light"}')
+    second = manager.create_backup().path / ".obsidian"
+
+    old_js = first / "plugins" / "dataview" / "main.js"
+    new_js = second / "plugins" / "dataview" / "main.js"
+    assert os.path.samestat(old_js.stat(), new_js.stat())
+    assert (second / "app.json").read_text() == '{"theme": "light"}'
+    assert (second / "app.json").stat().st_mtime_ns == (settings / "app.json").stat().st_mtime_ns
+
+    # Expiring the first backup takes its only copy of the old app.json
+    manager.max_backups = 1
+    manager._cleanup_old_backups()
+    manager._gc_executor.shutdown(wait=True)
+    assert not first.parent.exists()
+    objects = list(manager.objects_dir.iterdir())
+    assert len(objects) == 2
+    assert all(obj.stat().st_nlink == 2 for obj in objects)
+    assert [b.path.name for b in manager.list_backups()] == [second.parent.name]
+
+
+def test_dedupe_manifest_skips_hashing_unchanged_files(tmp_path, vault_settings):
+    """Test that incremental backups only hash files that changed."""
+    settings = vault_settings
+    (settings / "plugins" / "main.js").write_text("console.log(1)")
+
+    manager = BackupManager(
+        vault_path=settings.parent, backup_dir=tmp_path / "backups", dedupe=True
+    )
+
+    manager.create_backup()
+    (settings / "app.json").write_text('{"changed": true}')
+    with patch.object(backup_module, "file_digest", wraps=backup_module.file_digest) as spy:
+        latest = manager.create_backup().path / ".obsidian"
+        assert [os.path.relpath(c.args[0], settings) for c in spy.call_args_list] == ["app.json"]
+
+        manager.create_backup(full_backup=True)
+        assert spy.call_count == 3
+
+    assert (latest / "app.json").read_text() == '{"changed": true}'
+    assert (latest / "plugins" / "main.js").read_text() == "console.log(1)"
+    assert manager.manifest_path.is_file()
+
+
+def test_read_manifest_ignores_malformed_manifests(tmp_path):
+    """Test that manifests of the wrong shape read as empty."""
+    manager = BackupManager(tmp_path / "vault", backup_dir=tmp_path / "backups", dedupe=True)
+    assert manager._read_manifest() == {}
+
+    manager.backup_dir.mkdir()
+    for content in ("[]", '{"version": 1, "files": []}', "not json"):
+        manager.manifest_path.write_text(content)
+        assert manager._read_manifest() == {}
+
+    manager.manifest_path.write_text('{"version": 1, "files": {"app.json": [1, 2]}}')
+    assert manager._read_manifest() == {"app.json": [1, 2]}
+
+
+def test_backup_names_stay_ordered_when_the_clock_goes_back(restorable_vault, monkeypatch):
+    """Test that a wall clock stepped backwards can't reorder backups."""
+    manager, _ = restorable_vault
+    monkeypatch.setattr("obsyncit.backup.time.time_ns", lambda: 1_700_000_000_000_000_000)
+    first = manager.create_backup()
+    monkeypatch.setattr("obsyncit.backup.time.time_ns", lambda: 1_600_000_000_000_000_000)
+    second = manager.create_backup()
+
+    assert second.path.name == "backup_1700000000_000000001"
+    assert [b.path for b in manager.list_backups()][:2] == [second.path, first.path]
+
+
+def test_excluded_entries_are_skipped_and_kept_on_restore(restorable_vault):
+    """Test that transient entries stay out of backups but survive restore."""
+    manager, _ = restorable_vault
+    settings = manager.settings_dir
+    (settings / "workspace-mobile.json").write_text('{"panes": 1}')
+    (settings / ".trash" / "old").mkdir(parents=True)
+
+    backup = manager.create_backup().path / ".obsidian"
+    assert sorted(p.name for p in backup.iterdir()) == ["app.json", "plugins"]
+
+    (settings / "workspace-mobile.json").write_text('{"panes": 2}')
+    manager.restore_backup(backup.parent)
+    assert (settings / "workspace-mobile.json").read_text() == '{"panes": 2}'
+    assert (settings / ".trash" / "old").is_dir()
+
+    everything = BackupManager(
+        manager.vault_path, backup_dir=manager.backup_dir, exclude=()
+    )
+    backup = everything.create_backup().path / ".obsidian"
+    assert (backup / "workspace-mobile.json").is_file()
@@ -7,7 +7,8 @@ from pathlib import Path
 import pytest
 from unittest.mock import Mock, patch
 from loguru import logger
-from obsyncit.main import main
+from obsyncit import main as main_module
+from obsyncit.main import main, load_config
 from obsyncit.errors import ConfigError
 from obsyncit.vault_discovery import VaultDiscovery
 from obsyncit.obsync_tui import ObsidianSyncTUI
@@ -197,4 +198,36 @@ def test_cli_config_override_precedence(mock_sync_manager, mock_vault_discovery,
         mock_sync_manager.assert_called_once()
         
         # Verify the config was overridden by CLI args
-        assert mock_config.return_value.sync.dry_run is True
\ No newline at end of file
+        assert mock_config.return_value.sync.dry_run is True
+
+
+def test_load_config_reads_toml(tmp_path):
+    """Test that a TOML config file is parsed and validated."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[backup]\nmax_backups = 3\n\n[sync]\ndry_run = true\n')
+
+    config = load_config(config_file)
+    assert config.backup.max_backups == 3
+    assert config.sync.dry_run is True
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test that a missing config file raises ConfigError."""
+    with pytest.raises(ConfigError, match="not found"):
+        load_config(tmp_path / "missing.toml")
+
+
+def test_load_config_reuses_unchanged_file(tmp_path, mocker):
+    """Test that an unchanged config file is only validated once."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[backup]\nmax_backups = 3\n')
+
+    validate = mocker.spy(main_module._CONFIG_ADAPTER, "validate_python")
+    first = main_module.load_config(config_file)
+    second = main_module.load_config(config_file)
+
+    assert validate.call_count == 1
+    assert second.backup.max_backups == 3
+    # Each caller gets its own copy to apply overrides to
+    first.sync.dry_run = True
+    assert second.sync.dry_run is False
@@ -0,0 +1,231 @@
+"""Tests for low-level file operation helpers."""
+
+import errno
+import hashlib
+import os
+from unittest.mock import patch
+import pytest
+from obsyncit import fileops
+from obsyncit.fileops import fast_copy2, parallel_copytree
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """Create a source file larger than one copy chunk."""
+    src = tmp_path / "main.js"
+    src.write_bytes(os.urandom(fileops.COPY_BUFSIZE + 12345))
+    os.utime(src, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+    return src
+
+
+def test_fast_copy2_copies_content_and_metadata(source_file, tmp_path):
+    """Test that fast_copy2 behaves like shutil.copy2."""
+    dst = tmp_path / "copy.js"
+    fast_copy2(source_file, dst)
+
+    assert dst.read_bytes() == source_file.read_bytes()
+    assert dst.stat().st_mtime_ns == source_file.stat().st_mtime_ns
+
+
+def test_fast_copy2_sets_mode_and_replaces_existing_file(source_file, tmp_path):
+    """Test that permissions are copied and an existing copy is truncated."""
+    os.chmod(source_file, 0o640)
+    dst = tmp_path / "copy.js"
+    dst.write_bytes(b"x" * (fileops.COPY_BUFSIZE * 2))
+
+    fast_copy2(source_file, dst)
+    assert dst.read_bytes() == source_file.read_bytes()
+    assert dst.stat().st_mode & 0o777 == 0o640
+
+    with pytest.raises(IsADirectoryError):
+        fast_copy2(tmp_path, tmp_path / "dir-copy")
+
+
+def test_fast_copy2_empty_file(tmp_path):
+    """Test copying an empty file."""
+    src = tmp_path / "empty.json"
+    src.write_bytes(b"")
+    dst = tmp_path / "copy.json"
+    fast_copy2(src, dst)
+    assert dst.read_bytes() == b""
+
+
+def test_fast_copy2_falls_back_when_kernel_copy_unsupported(source_file, tmp_path):
+    """Test the userspace fallback when kernel copies are refused."""
+    unsupported = OSError(errno.EXDEV, "cross-device")
+    dst = tmp_path / "copy.js"
+    with patch.object(fileops, "_copy_file_range", side_effect=unsupported), \
+            patch.object(fileops, "_sendfile", side_effect=unsupported):
+        fast_copy2(source_file, dst)
+
+    assert dst.read_bytes() == source_file.read_bytes()
+
+
+def test_fast_copy2_hints_sequential_reads(source_file, tmp_path):
+    """Test that multi-chunk files get a readahead hint and small ones don't."""
+    if not fileops._HAS_FADVISE:
+        pytest.skip("posix_fadvise not available")
+    small = tmp_path / "app.json"
+    small.write_bytes(b"{}")
+
+    with patch.object(fileops.os, "posix_fadvise") as fadvise:
+        fast_copy2(small, tmp_path / "small-copy.json")
+        fadvise.assert_not_called()
+
+        fast_copy2(source_file, tmp_path / "copy.js")
+        fadvise.assert_called_once()
+        assert fadvise.call_args[0][3] == os.POSIX_FADV_SEQUENTIAL
+
+    assert (tmp_path / "copy.js").read_bytes() == source_file.read_bytes()
+
+
+def test_fast_copy2_propagates_real_errors(source_file, tmp_path):
+    """Test that genuine I/O errors are not swallowed by the fallbacks."""
+    if not fileops._HAS_COPY_FILE_RANGE:
+        pytest.skip("copy_file_range not available")
+    with patch.object(
+        fileops, "_copy_file_range", side_effect=OSError(errno.ENOSPC, "full")
+    ):
+        with pytest.raises(OSError):
+            fast_copy2(source_file, tmp_path / "copy.js")
+
+
+@pytest.fixture
+def settings_tree(tmp_path):
+    """Create a small .obsidian-like tree."""
+    root = tmp_path / "src" / ".obsidian"
+    (root / "plugins" / "dataview").mkdir(parents=True)
+    (root / "themes").mkdir()
+    (root / "app.json").write_text('{"theme": "dark"}')
+    (root / "plugins" / "dataview" / "main.js").write_text("// plugin")
+    (root / "plugins" / "dataview" / "data.json").write_text("{}")
+    return root
+
+
+def test_parallel_copytree_copies_tree(settings_tree, tmp_path):
+    """Test that every file and directory, including empty ones, is copied."""
+    dst = tmp_path / "dst" / ".obsidian"
+    parallel_copytree(settings_tree, dst)
+
+    copied = sorted(p.relative_to(dst) for p in dst.rglob("*"))
+    expected = sorted(p.relative_to(settings_tree) for p in settings_tree.rglob("*"))
+    assert copied == expected
+    assert (dst / "plugins" / "dataview" / "main.js").read_text() == "// plugin"
+    assert (dst / "themes").is_dir()
+
+
+def test_parallel_copytree_surfaces_copy_errors(settings_tree, tmp_path):
+    """Test that a failing file copy is raised to the caller."""
+    def failing_copy(src, dst):
+        raise OSError(errno.EACCES, "denied", src)
+
+    with pytest.raises(OSError):
+        parallel_copytree(settings_tree, tmp_path / "dst", copy_function=failing_copy)
+
+
+def test_parallel_copytree_returns_inventory(settings_tree, tmp_path):
+    """Test that the returned inventory lists every copied path."""
+    dst = tmp_path / "dst"
+    copied = parallel_copytree(settings_tree, dst)
+    assert sorted(copied) == sorted(
+        str(p.relative_to(settings_tree)) for p in settings_tree.rglob("*")
+    )
+
+
+def test_clone_copy2_falls_back_and_remembers(source_file, tmp_path, monkeypatch):
+    """Test that an unsupported clone falls back and is not retried."""
+    if not fileops._HAS_FICLONE:
+        pytest.skip("FICLONE not available")
+    calls = []
+
+    def refuse_clone(fd, request, arg):
+        calls.append(request)
+        raise OSError(errno.EOPNOTSUPP, "not supported")
+
+    monkeypatch.setattr(fileops, "_clone_support", {})
+    monkeypatch.setattr(fileops.fcntl, "ioctl", refuse_clone)
+    for name in ("a.js", "b.js"):
+        fileops.clone_copy2(source_file, tmp_path / name)
+        assert (tmp_path / name).read_bytes() == source_file.read_bytes()
+
+    assert calls == [fileops.FICLONE]
+
+
+def test_pipe_copytree_copies_tree(settings_tree, tmp_path):
+    """Test copying a tree through the external copy tool."""
+    dst = tmp_path / "dst" / ".obsidian"
+    copied = fileops.pipe_copytree(settings_tree, dst)
+
+    expected = sorted(str(p.relative_to(settings_tree)) for p in settings_tree.rglob("*"))
+    assert sorted(copied) == expected
+    assert sorted(str(p.relative_to(dst)) for p in dst.rglob("*")) == expected
+    assert (dst / "app.json").stat().st_mtime_ns == (settings_tree / "app.json").stat().st_mtime_ns
+
+
+def test_pipe_copytree_falls_back_without_tool(settings_tree, tmp_path, monkeypatch):
+    """Test the thread pool fallback when no external tool is available."""
+    monkeypatch.setattr(fileops.shutil, "which", lambda name: None)
+    dst = tmp_path / "dst"
+    copied = fileops.pipe_copytree(settings_tree, dst)
+    assert (dst / "plugins" / "dataview" / "main.js").read_text() == "// plugin"
+    assert len(copied) == len(list(settings_tree.rglob("*")))
+
+
+def test_fast_rmtree_removes_tree_with_and_without_rm(settings_tree, tmp_path, monkeypatch):
+    """Test deleting a tree with rm and with the shutil fallback."""
+    fileops.fast_rmtree(settings_tree)
+    assert not settings_tree.exists()
+
+    (settings_tree / "plugins").mkdir(parents=True)
+    monkeypatch.setattr(fileops.shutil, "which", lambda name: None)
+    fileops.fast_rmtree(settings_tree)
+    assert not settings_tree.exists()
+    with pytest.raises(FileNotFoundError):
+        fileops.fast_rmtree(settings_tree)
+
+
+def test_same_filesystem_handles_missing_paths(tmp_path):
+    """Test that paths that don't exist yet use their nearest ancestor."""
+    assert fileops.same_filesystem(tmp_path, tmp_path / "not" / "yet" / "created")
+
+
+def test_copytrees_skip_excluded_top_level_entries(settings_tree, tmp_path, monkeypatch):
+    """Test that excluded names are skipped at the top level only."""
+    (settings_tree / "workspace-mobile.json").write_text("{}")
+    (settings_tree / "plugins" / "workspace-mobile.json").write_text("{}")
+    exclude = {"workspace-mobile.json", "themes"}
+
+    copied = parallel_copytree(settings_tree, tmp_path / "a", exclude=exclude)
+    piped = fileops.pipe_copytree(settings_tree, tmp_path / "b", exclude=exclude)
+    assert sorted(copied) == sorted(piped)
+    for root in (tmp_path / "a", tmp_path / "b"):
+        assert sorted(p.name for p in root.iterdir()) == ["app.json", "plugins"]
+        assert (root / "plugins" / "workspace-mobile.json").is_file()
+
+
+def test_file_digest_matches_blake2b_for_small_and_large_files(tmp_path, monkeypatch):
+    """Test that the single-read and streaming paths hash identically."""
+    monkeypatch.setattr(fileops, "COPY_BUFSIZE", 16)
+
+    for size in (0, 15, 16, 100):
+        path = tmp_path / f"data_{size}"
+        path.write_bytes(bytes(range(size)))
+        assert fileops.file_digest(path) == hashlib.blake2b(bytes(range(size))).digest()
+
+
+def test_pipe_copytree_uses_robocopy_on_windows(settings_tree, tmp_path, monkeypatch):
+    """Test the robocopy command line and its success exit codes."""
+    monkeypatch.setattr(fileops.sys, "platform", "win32")
+    monkeypatch.setattr(fileops.shutil, "which", lambda name: name)
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return fileops.subprocess.CompletedProcess(cmd, 1)
+
+    monkeypatch.setattr(fileops.subprocess, "run", run)
+    with patch.object(fileops, "parallel_copytree") as fallback:
+        fileops.pipe_copytree(settings_tree, tmp_path / "dst", max_workers=300)
+    fallback.assert_not_called()
+    assert calls[0][:4] == ["robocopy", str(settings_tree), str(tmp_path / "dst"), "/E"]
+    assert "/MT:128" in calls[0]
@@ -90,3 +90,54 @@ def test_validate_json_file_nonexistent(sync_manager, tmp_path):
     
     with pytest.raises(ObsyncError, match="File not found"):
         sync_manager.validate_json_file(test_file)
+
+
+def test_validate_json_file_without_orjson(sync_manager, tmp_path, monkeypatch):
+    """Test that validation falls back to the json module."""
+    import obsyncit.sync as sync_module
+    monkeypatch.setattr(sync_module, "orjson", None)
+
+    test_file = tmp_path / "test.json"
+    test_file.write_text('{"valid": "json"}')
+    assert sync_manager.validate_json_file(test_file) == {"valid": "json"}
+
+
+def test_validate_json_file_accepts_nan(sync_manager, tmp_path):
+    """Test that documents only the json module accepts still validate."""
+    test_file = tmp_path / "nan.json"
+    test_file.write_text('{"zoom": NaN}')
+    data = sync_manager.validate_json_file(test_file)
+    assert data["zoom"] != data["zoom"]
+
+
+def test_validate_json_file_large_file(sync_manager, tmp_path, monkeypatch):
+    """Test that files above the mmap threshold parse the same way."""
+    import obsyncit.sync as sync_module
+    monkeypatch.setattr(sync_module, "MMAP_THRESHOLD", 16)
+
+    test_file = tmp_path / "data.json"
+    payload = {"entries": [{"id": i, "name": f"note-{i}"} for i in range(100)]}
+    test_file.write_text(json.dumps(payload))
+    assert sync_manager.validate_json_file(test_file) == payload
+
+    test_file.write_text('{"zoom": NaN, "padding": "' + "x" * 32 + '"}')
+    assert sync_manager.validate_json_file(test_file)["padding"] == "x" * 32
+
+
+def test_vault_validate_json_file(temp_vault, tmp_path, monkeypatch):
+    """Test the vault's validity-only JSON check with and without orjson."""
+    import obsyncit.vault as vault_module
+    from obsyncit.vault import VaultManager
+
+    vault = VaultManager(temp_vault)
+    valid = tmp_path / "valid.json"
+    valid.write_text('{"theme": "obsidian", "zoom": NaN}')
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text('{"theme": ')
+
+    for parser in (vault_module.orjson, None):
+        monkeypatch.setattr(vault_module, "orjson", parser)
+        assert vault.validate_json_file(valid) is True
+        assert vault.validate_json_file(tmp_path / "missing.json") is False
+        with pytest.raises(ValidationError):
+            vault.validate_json_file(invalid)
@@ -2,6 +2,7 @@
 
 import sys
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 from loguru import logger
 from obsyncit.logger import setup_logging
@@ -192,4 +193,21 @@ def test_setup_logging_integration(sample_config, temp_log_dir):
         content = f.read()
         assert test_message in content
         for level in ["DEBUG", "INFO", "WARNING", "ERROR"]:
-            assert level in content
\ No newline at end of file
+            assert level in content
+
+
+def test_setup_logging_is_idempotent(sample_config, temp_log_dir):
+    """Test that repeating setup with the same settings adds no handlers."""
+    sample_config.logging.log_dir = str(temp_log_dir)
+    setup_logging(sample_config)
+    log_files = list(temp_log_dir.glob("*.log"))
+
+    with patch.object(logger, "add") as mock_add:
+        setup_logging(sample_config)
+    mock_add.assert_not_called()
+    assert list(temp_log_dir.glob("*.log")) == log_files
+
+    sample_config.logging.level = "ERROR"
+    with patch.object(logger, "add") as mock_add:
+        setup_logging(sample_config)
+    assert mock_add.call_count == 2
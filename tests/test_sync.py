@@ -1,6 +1,9 @@
 """Tests for syncing functionality."""
 
+import dataclasses
 import json
+import os
+import threading
 from pathlib import Path
 import pytest
 from obsyncit.sync import SyncManager, SyncResult
@@ -18,10 +21,11 @@ def sample_vaults(clean_dir):
 
 
 @pytest.fixture
-def sync_manager(sample_vaults):
+def sync_manager(sample_vaults, tmp_path):
     """Create a sync manager with test configuration."""
     source_vault, target_vault = sample_vaults
     config = Config()
+    config.backup.backup_dir = str(tmp_path / "backups")
     config.sync.dry_run = False
     config.sync.ignore_errors = False
     return SyncManager(source_vault, target_vault, config)
@@ -231,4 +235,162 @@ def test_sync_plugin_related_files(sync_manager, setup_plugins):
         if item == "plugins":
             assert (sync_manager.target.settings_dir / item).is_dir()
         else:
-            assert (sync_manager.target.settings_dir / item).is_file()
\ No newline at end of file
+            assert (sync_manager.target.settings_dir / item).is_file()
+
+
+def test_sync_item_skips_unchanged_files(sync_manager, monkeypatch):
+    """Test that files matching the target by size and mtime are skipped."""
+    source = sync_manager.source.settings_dir / "app.json"
+    target = sync_manager.target.settings_dir / "app.json"
+    source.write_text('{"theme": "dark"}')
+
+    sync_manager._sync_item("app.json")
+    assert target.read_text() == '{"theme": "dark"}'
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged file was processed again")
+
+    monkeypatch.setattr(sync_manager, "validate_json_file", fail)
+    monkeypatch.setattr("obsyncit.sync.clone_copy2", fail)
+    monkeypatch.setattr("obsyncit.sync._copy_if_changed", fail)
+    sync_manager._sync_item("app.json")
+
+
+def test_get_sync_items_respects_config_and_filter(sync_manager):
+    """Test item selection from a single scan of the source settings."""
+    settings = sync_manager.source.settings_dir
+    (settings / "themes").mkdir(exist_ok=True)
+    (settings / "snippets").mkdir(exist_ok=True)
+    (settings / "community-plugins.json").write_text("[]")
+
+    sync_manager.config.sync.snippets = False
+    items = sync_manager._get_sync_items()
+    assert {"app.json", "themes", "community-plugins.json"} <= items
+    assert "snippets" not in items
+
+    assert sync_manager._get_sync_items(["themes", "snippets", "missing.json"]) == {"themes"}
+    assert sync_manager._get_sync_items([]) == set()
+
+
+def test_sync_settings_skips_when_already_in_sync(sync_manager, monkeypatch):
+    """Test that no backup or copy happens when the target already matches."""
+    monkeypatch.setattr(sync_manager, "_validate_vaults", lambda: None)
+    for item in sync_manager._get_sync_items():
+        sync_manager._sync_item(item)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("in-sync vault was processed again")
+
+    monkeypatch.setattr(sync_manager, "_create_backup", fail)
+    monkeypatch.setattr(sync_manager, "_sync_item", fail)
+    result = sync_manager.sync_settings()
+    assert result.success
+    assert result.items_synced
+
+    (sync_manager.source.settings_dir / "app.json").write_text('{"changed": true}')
+    assert not sync_manager._is_in_sync({"app.json"})
+
+
+def test_sync_item_reuses_cached_stats(sync_manager, monkeypatch):
+    """Test that item checks share one stat per path within a sync run."""
+    source = sync_manager.source.settings_dir / "app.json"
+    target = sync_manager.target.settings_dir / "app.json"
+    source.write_text('{"theme": "dark"}')
+
+    sync_manager._sync_item("app.json")
+    assert target.read_text() == '{"theme": "dark"}'
+    # The source result is kept; the rewritten target is dropped
+    assert os.fspath(source) in sync_manager._stat_cache
+    assert os.fspath(target) not in sync_manager._stat_cache
+
+    # Each sync_settings call starts from a fresh cache
+    monkeypatch.setattr(sync_manager, "_validate_vaults", lambda: None)
+    monkeypatch.setattr(sync_manager, "_create_backup", lambda: None)
+    source.write_text('{"theme": "light"}')
+    assert sync_manager.sync_settings(["app.json"]).success
+    assert target.read_text() == '{"theme": "light"}'
+
+
+def test_sync_settings_runs_items_concurrently(sync_manager, monkeypatch):
+    """Test that items are synced on worker threads and all reported."""
+    monkeypatch.setattr(sync_manager, "_validate_vaults", lambda: None)
+    monkeypatch.setattr(sync_manager, "_create_backup", lambda: None)
+    monkeypatch.setattr(sync_manager, "_is_in_sync", lambda items: False)
+
+    threads = {}
+
+    def record(item):
+        threads[item] = threading.current_thread().name
+
+    monkeypatch.setattr(sync_manager, "_sync_item", record)
+    result = sync_manager.sync_settings(["app.json", "appearance.json"])
+
+    assert result.success
+    assert result.items_synced == ["app.json", "appearance.json"]
+    assert all(name.startswith("obsyncit-sync") for name in threads.values())
+
+
+def test_sync_item_skips_identical_content(sync_manager, monkeypatch):
+    """Test that files differing only in mtime get metadata, not a copy."""
+    source = sync_manager.source.settings_dir / "app.json"
+    target = sync_manager.target.settings_dir / "app.json"
+    source.write_text('{"theme": "dark"}')
+    target.write_text('{"theme": "dark"}')
+    os.utime(target, ns=(0, 0))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("identical file was validated or copied")
+
+    monkeypatch.setattr(sync_manager, "validate_json_file", fail)
+    monkeypatch.setattr("obsyncit.sync.clone_copy2", fail)
+    monkeypatch.setattr("obsyncit.sync._copy_if_changed", fail)
+    sync_manager._sync_item("app.json")
+
+    # The timestamps were brought over, so the next run skips on stat
+    assert target.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+def test_sync_item_copies_directory_changes(sync_manager):
+    """Test that directory items copy new files and rewrite changed ones."""
+    source_theme = sync_manager.source.settings_dir / "themes" / "Minimal"
+    source_theme.mkdir(parents=True)
+    (source_theme / "theme.css").write_text("body {}")
+    (source_theme / "manifest.json").write_text('{"name": "Minimal"}')
+
+    sync_manager._sync_item("themes")
+    target_theme = sync_manager.target.settings_dir / "themes" / "Minimal"
+    assert (target_theme / "theme.css").read_text() == "body {}"
+
+    (source_theme / "theme.css").write_text("body { color: red; }")
+    sync_manager._stat_cache.clear()
+    sync_manager._sync_item("themes")
+    assert (target_theme / "theme.css").read_text() == "body { color: red; }"
+    assert (target_theme / "manifest.json").read_text() == '{"name": "Minimal"}'
+
+
+def test_sync_result_is_slotted_and_frozen():
+    """Test that results carry no per-instance dict and cannot be changed."""
+    result = SyncResult(True, ["app.json"], [], {})
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.success = False
+
+
+def test_sync_settings_stops_queued_items_after_failure(sync_manager, monkeypatch):
+    """Test that items not yet started are skipped once one item fails."""
+    monkeypatch.setattr("obsyncit.sync.MAX_SYNC_WORKERS", 1)
+    monkeypatch.setattr(sync_manager, "_validate_vaults", lambda: None)
+    monkeypatch.setattr(sync_manager, "_create_backup", lambda: None)
+    monkeypatch.setattr(sync_manager, "_is_in_sync", lambda items: False)
+
+    started = []
+
+    def failing_sync(item):
+        started.append(item)
+        raise SyncError(f"Failed to sync {item}")
+
+    monkeypatch.setattr(sync_manager, "_sync_item", failing_sync)
+    result = sync_manager.sync_settings(["app.json", "appearance.json"])
+
+    assert not result.success
+    assert started == ["app.json"]